@@ -3,28 +3,32 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import uuid
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
 from meeting.domain.pause_resume import find_last_pause_token, make_resume_event
 from meeting.config import get_role_prompts
-from meeting.domain.state_machine import next_round_from_events, run_meeting
+from meeting.domain.context_builder import build_user_task
+from meeting.domain.models import new_id
+from meeting.jsonutil import dumps, loads
+from meeting.domain.state_machine import RESUME_EVENT_TYPES, next_round_from_events, run_meeting
 from meeting.runners.langchain_runner import create_runner
 from meeting.storage.repo import StorageRepo
 
 
 def _now_ms() -> int:
     # Timestamp helper for user message events.
-    import time
-
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 class MeetingCreate(BaseModel):
@@ -54,17 +58,22 @@ class RunStartRequest(BaseModel):
     overrides: Dict[str, Any] = Field(default_factory=dict)
 
 
-def _build_user_task(config: Dict[str, Any]) -> str:
-    # Merge topic/background/constraints into a single prompt string.
-    topic = config.get("topic", "")
-    background = config.get("background", "")
-    constraints = config.get("constraints", {})
-    return f"{topic}\n{background}\n{json.dumps(constraints)}".strip()
+def _parse_config(config_json: str) -> Dict[str, Any]:
+    # Parse a stored meeting/run config blob; each call returns a fresh dict the run may own.
+    return loads(config_json)
+
+
+# Only meetings being started or resumed right now hit this cache; 32 entries covers
+# them without pinning every config blob the process has ever seen.
+@lru_cache(maxsize=32)
+def _user_task_for_config(config_json: str) -> str:
+    # Prompt task for a stored config blob; resumes reuse it instead of re-encoding constraints.
+    return build_user_task(_parse_config(config_json))
 
 
 def _user_message_event(run_id: str, content: str) -> Dict[str, Any]:
     # Represent user input as an agent_message event for replay.
-    message_id = f"msg-{uuid.uuid4().hex}"
+    message_id = new_id("msg")
     payload = {
         "message": {
             "role": "user",
@@ -86,30 +95,163 @@ def _user_message_event(run_id: str, content: str) -> Dict[str, Any]:
     }
 
 
-def _format_sse(event: Dict[str, Any]) -> str:
-    # Format SSE payload for event streaming.
-    data = json.dumps(event, ensure_ascii=False)
-    return f"id: {event.get('id', 0)}\ndata: {data}\n\n"
+# Event row fields encoded ahead of the raw payload in SSE frames.
+_SSE_HEAD_KEYS = ("id", "run_id", "ts_ms", "type", "actor")
+
+
+def _format_sse(event: Dict[str, Any]) -> bytes:
+    # Format SSE payload for event streaming (dumps emits UTF-8 bytes directly).
+    payload_json = event.get("payload_json")
+    if payload_json is None:
+        return b"id: %d\ndata: %b\n\n" % (event.get("id", 0), dumps(event))
+    # Splice the stored payload JSON in as-is instead of decoding and re-encoding it.
+    head = dumps({key: event[key] for key in _SSE_HEAD_KEYS})
+    return b'id: %d\ndata: %b,"payload":%b}\n\n' % (event["id"], head[:-1], payload_json.encode())
+
+
+def _json_response(content: Any) -> Response:
+    # Pre-serialized JSON body; returning a Response skips FastAPI's jsonable_encoder walk.
+    return Response(content=dumps(content), media_type="application/json")
+
+
+def _json_list_chunks(key: str, items: Iterable[Any], chunk_size: int = 65536) -> Iterator[bytes]:
+    # Encode {"<key>": [...]} incrementally, yielding roughly chunk_size bytes at a time.
+    buffer = bytearray(b'{"%b":[' % key.encode())
+    separator = b""
+    for item in items:
+        buffer += separator
+        buffer += dumps(item)
+        separator = b","
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]}"
+    yield bytes(buffer)
+
+
+# Seconds an idle SSE stream waits for new events before sending a keep-alive.
+_SSE_KEEPALIVE_S = 15.0
+_SSE_KEEPALIVE = b": keep-alive\n\n"
+
+# Upper bound on encoded SSE frames kept per app for replay to later subscribers.
+_SSE_CACHE_MAX = 4096
+
+
+def _format_sse_cached(event: Dict[str, Any], cache: OrderedDict[int, bytes]) -> bytes:
+    # Event rows are append-only, so the encoded frame can be reused by row id.
+    event_id = event.get("id")
+    frame = cache.get(event_id)
+    if frame is not None:
+        cache.move_to_end(event_id)
+        return frame
+    frame = _format_sse(event)
+    cache[event_id] = frame
+    if len(cache) > _SSE_CACHE_MAX:
+        cache.popitem(last=False)
+    return frame
 
 
 def _merge_config(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
     # Merge overrides into the base config (deep merge for nested dicts).
+    # Iterative, and only dicts on an override path are copied; base is never mutated.
     merged = dict(base)
-    for key, value in overrides.items():
-        if isinstance(value, dict) and isinstance(merged.get(key), dict):
-            merged[key] = _merge_config(merged[key], value)
-        else:
-            merged[key] = value
+    stack = [(merged, overrides)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                nested = dict(current)
+                target[key] = nested
+                stack.append((nested, value))
+            else:
+                target[key] = value
     return merged
 
 
+# Seconds shutdown waits for in-flight runs before cancelling them.
+_SHUTDOWN_DRAIN_S = 10.0
+
+
+# _lifespan: app lifespan hook that drains background runs, then closes storage.
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # Give in-flight runs a bounded grace period, then cancel the rest so no writer
+    # is still running when storage closes.
+    tasks = list(app.state.run_tasks.values())
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=_SHUTDOWN_DRAIN_S)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    app.state.storage.close()
+
+
 # create_app: FastAPI factory for the meeting service.
 def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
-    app = FastAPI(title="Meeting System MVP")
+    app = FastAPI(title="Meeting System MVP", lifespan=_lifespan)
 
     # Shared app state for storage and runner.
     app.state.storage = StorageRepo(Path(db_path))
     app.state.runner = create_runner()
+    # Encoded SSE frames keyed by event row id (row ids are unique per database).
+    app.state.sse_cache = OrderedDict()
+    # Wakeup signals for SSE subscribers: run_id -> {(loop, asyncio.Event)}. Appends
+    # notify from worker threads, so the map is only touched under the lock.
+    app.state.event_signals = {}
+    app.state.event_signals_lock = threading.Lock()
+
+    def _notify_event_appended(run_id: str) -> None:
+        # Wake stream subscribers of the run; appends may happen on worker threads.
+        with app.state.event_signals_lock:
+            subscribers = tuple(app.state.event_signals.get(run_id, ()))
+        for loop, signal in subscribers:
+            if loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(signal.set)
+            except RuntimeError:
+                # The loop closed after the check; its stream is gone.
+                pass
+
+    app.state.storage.add_event_listener(_notify_event_appended)
+    # Background meeting tasks by run_id (holds references until each run ends).
+    app.state.run_tasks = {}
+
+    def _launch_run(
+        meeting_id: str,
+        run_id: str,
+        config: Dict[str, Any],
+        user_task: str,
+        start_round: int,
+    ) -> asyncio.Task:
+        # Execute the meeting in the background; clients follow progress via events.
+        async def _run() -> Dict[str, Any] | None:
+            try:
+                return await run_meeting(
+                    storage=app.state.storage,
+                    runner=app.state.runner,
+                    meeting_id=meeting_id,
+                    run_id=run_id,
+                    config=config,
+                    user_task=user_task,
+                    start_round=start_round,
+                )
+            except asyncio.CancelledError:
+                # Cancelled at shutdown; record it so clients stop waiting on the run.
+                app.state.storage.set_run_status(run_id, "FAILED")
+                raise
+            except Exception:
+                app.state.storage.set_run_status(run_id, "FAILED")
+                return None
+            finally:
+                if app.state.run_tasks.get(run_id) is asyncio.current_task():
+                    del app.state.run_tasks[run_id]
+
+        task = asyncio.create_task(_run())
+        app.state.run_tasks[run_id] = task
+        return task
 
     # Serve static UI files from docs/ at /static.
     app.mount("/static", StaticFiles(directory="docs"), name="static")
@@ -119,7 +261,7 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         # Persist meeting config.
         config = payload.model_dump()
         if not config.get("role_prompts"):
-            config["role_prompts"] = get_role_prompts()
+            config["role_prompts"] = dict(get_role_prompts())
         meeting_id = app.state.storage.create_meeting(config)
         return {"meeting_id": meeting_id, "config": config}
 
@@ -127,7 +269,7 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
     def list_meetings(limit: int = 100):
         # List recent meetings.
         meetings = app.state.storage.list_meetings(limit=limit)
-        return {"meetings": meetings}
+        return _json_response({"meetings": meetings})
 
     @app.get("/meetings/{meeting_id}/runs")
     def list_runs_for_meeting(meeting_id: str, limit: int = 100):
@@ -136,13 +278,13 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         if not meeting:
             raise HTTPException(status_code=404, detail="meeting not found")
         runs = app.state.storage.list_runs(limit=limit, meeting_id=meeting_id)
-        return {"meeting_id": meeting_id, "runs": runs}
+        return _json_response({"meeting_id": meeting_id, "runs": runs})
 
     @app.get("/runs")
     def list_runs(limit: int = 100):
         # List recent runs across all meetings.
         runs = app.state.storage.list_runs(limit=limit)
-        return {"runs": runs}
+        return _json_response({"runs": runs})
 
     @app.post("/meetings/{meeting_id}/runs")
     async def start_run(meeting_id: str, payload: RunStartRequest | None = None):
@@ -150,27 +292,16 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         meeting = app.state.storage.get_meeting(meeting_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="meeting not found")
-        config = json.loads(meeting["config_json"])
+        config = _parse_config(meeting["config_json"])
         overrides = payload.overrides if payload else {}
-        run_config = _merge_config(config, overrides) if overrides else config
+        if overrides:
+            run_config = _merge_config(config, overrides)
+            user_task = build_user_task(run_config)
+        else:
+            run_config = config
+            user_task = _user_task_for_config(meeting["config_json"])
         run_id = app.state.storage.create_run(meeting_id, run_config)
-        user_task = _build_user_task(run_config)
-
-        async def _run():
-            try:
-                await run_meeting(
-                    storage=app.state.storage,
-                    runner=app.state.runner,
-                    meeting_id=meeting_id,
-                    run_id=run_id,
-                    config=run_config,
-                    user_task=user_task,
-                    start_round=1,
-                )
-            except Exception:
-                app.state.storage.set_run_status(run_id, "FAILED")
-
-        asyncio.create_task(_run())
+        _launch_run(meeting_id, run_id, run_config, user_task, start_round=1)
         return {"meeting_id": meeting_id, "run_id": run_id, "status": "RUNNING"}
 
     @app.post("/meetings/{meeting_id}/runs/{run_id}/messages")
@@ -183,40 +314,34 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         return {"status": "OK"}
 
     @app.post("/meetings/{meeting_id}/runs/{run_id}/resume")
-    async def resume_run(meeting_id: str, run_id: str, payload: ResumeRequest):
-        # Resume a paused run with answers.
+    async def resume_run(meeting_id: str, run_id: str, payload: ResumeRequest, wait: bool = False):
+        # Resume a paused run with answers; the run continues in the background unless
+        # wait=true, which keeps the old blocking response with the run's artifacts.
         run = app.state.storage.get_run(run_id)
         if not run:
             raise HTTPException(status_code=404, detail="run not found")
-        config = json.loads(run["config_json"])
-        events = app.state.storage.list_events(run_id)
+        if run_id in app.state.run_tasks or run.get("status") == "RUNNING":
+            raise HTTPException(status_code=409, detail="run is already running")
+        config = _parse_config(run["config_json"])
+        events = app.state.storage.list_events(run_id, types=RESUME_EVENT_TYPES)
         expected = find_last_pause_token(events)
         if expected and payload.resume_token != expected:
             raise HTTPException(status_code=400, detail="invalid resume token")
 
         resume_event = make_resume_event(run_id, payload.resume_token, payload.answers)
-        app.state.storage.append_event_dict(
-            {
-                "type": resume_event.type,
-                "run_id": resume_event.run_id,
-                "ts_ms": resume_event.ts_ms,
-                "actor": resume_event.actor,
-                "payload": {**resume_event.payload, "event_code": "RESUMED"},
-            }
-        )
+        resume_event["payload"]["event_code"] = "RESUMED"
+        app.state.storage.append_event_dict(resume_event)
 
         start_round = next_round_from_events(events)
         app.state.storage.set_run_status(run_id, "RUNNING")
-        user_task = _build_user_task(config)
-        result = await run_meeting(
-            storage=app.state.storage,
-            runner=app.state.runner,
-            meeting_id=meeting_id,
-            run_id=run_id,
-            config=config,
-            user_task=user_task,
-            start_round=start_round,
-        )
+        user_task = _user_task_for_config(run["config_json"])
+        task = _launch_run(meeting_id, run_id, config, user_task, start_round=start_round)
+        if not wait:
+            return {"meeting_id": meeting_id, "run_id": run_id, "status": "RUNNING"}
+        # Shielded so a client disconnect does not cancel the run itself.
+        result = await asyncio.shield(task)
+        if result is None:
+            return {"run_id": run_id, "status": "FAILED", "artifacts": None}
         return {"run_id": run_id, "status": result.get("status"), "artifacts": result.get("artifacts")}
 
     @app.get("/meetings/{meeting_id}/runs/{run_id}")
@@ -226,7 +351,7 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         if not run:
             raise HTTPException(status_code=404, detail="run not found")
         artifacts = app.state.storage.list_artifacts(run_id)
-        return {"run": run, "artifacts": artifacts}
+        return _json_response({"run": run, "artifacts": artifacts})
 
     @app.get("/meetings/{meeting_id}/runs/{run_id}/events")
     def get_events(meeting_id: str, run_id: str, include_tokens: bool = True):
@@ -234,10 +359,9 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         run = app.state.storage.get_run(run_id)
         if not run:
             raise HTTPException(status_code=404, detail="run not found")
-        events = app.state.storage.list_events(run_id)
-        if not include_tokens:
-            events = [event for event in events if event.get("type") != "token"]
-        return {"events": events}
+        # Stream the same {"events": [...]} document without materializing the run.
+        events = app.state.storage.iter_events(run_id, include_tokens=include_tokens)
+        return StreamingResponse(_json_list_chunks("events", events), media_type="application/json")
 
     @app.get("/meetings/{meeting_id}/runs/{run_id}/events/stream")
     async def stream_events(
@@ -245,39 +369,64 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         run_id: str,
         after_id: Optional[int] = None,
         tail: int = 200,
-        poll_ms: int = 1000,
+        poll_ms: Optional[int] = None,
     ):
-        # Stream events using Server-Sent Events (SSE).
+        # Stream events using Server-Sent Events (SSE). poll_ms is still accepted for
+        # older clients but ignored: streams wake on appends instead of polling.
         run = app.state.storage.get_run(run_id)
         if not run or run.get("meeting_id") != meeting_id:
             raise HTTPException(status_code=404, detail="run not found")
 
         safe_tail = max(0, min(int(tail or 0), 500))
-        safe_poll_ms = max(200, min(int(poll_ms or 1000), 5000))
 
         async def event_generator():
-            # Yield recent events first, then poll for new ones.
-            last_id = int(after_id or 0)
-            if after_id is None and safe_tail:
-                for event in app.state.storage.list_recent_event_rows(run_id, limit=safe_tail):
-                    last_id = event["id"]
-                    yield _format_sse(event)
-
-            idle_cycles = 0
-            keepalive_every = max(1, int(15000 / safe_poll_ms))
-
-            while True:
-                events = app.state.storage.list_event_rows_after(run_id, last_id, limit=200)
-                if events:
-                    idle_cycles = 0
+            # Yield recent events first, then wait for appends to this run.
+            signal = asyncio.Event()
+            subscriber = (asyncio.get_running_loop(), signal)
+            with app.state.event_signals_lock:
+                app.state.event_signals.setdefault(run_id, set()).add(subscriber)
+            try:
+                last_id = int(after_id or 0)
+                if after_id is None and safe_tail:
+                    for event in app.state.storage.list_recent_event_rows(
+                        run_id, limit=safe_tail, decode_payload=False
+                    ):
+                        last_id = event["id"]
+                        yield _format_sse_cached(event, app.state.sse_cache)
+
+                next_keepalive = time.monotonic() + _SSE_KEEPALIVE_S
+                while True:
+                    # Clear before querying so an append racing the query still wakes us.
+                    signal.clear()
+                    events = app.state.storage.list_event_rows_after(
+                        run_id, last_id, limit=200, decode_payload=False
+                    )
                     for event in events:
                         last_id = event["id"]
-                        yield _format_sse(event)
-                else:
-                    idle_cycles += 1
-                    if idle_cycles % keepalive_every == 0:
-                        yield ": keep-alive\n\n"
-                await asyncio.sleep(safe_poll_ms / 1000)
+                        yield _format_sse_cached(event, app.state.sse_cache)
+                    if len(events) >= 200:
+                        continue
+                    if events:
+                        # Any frame keeps the connection alive; push the deadline back.
+                        next_keepalive = time.monotonic() + _SSE_KEEPALIVE_S
+                    remaining = next_keepalive - time.monotonic()
+                    if remaining <= 0:
+                        # Idle: keep the connection open; the re-query also picks up
+                        # events written by other processes sharing the database.
+                        yield _SSE_KEEPALIVE
+                        next_keepalive += _SSE_KEEPALIVE_S
+                        continue
+                    try:
+                        await asyncio.wait_for(signal.wait(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                with app.state.event_signals_lock:
+                    subscribers = app.state.event_signals.get(run_id)
+                    if subscribers is not None:
+                        subscribers.discard(subscriber)
+                        if not subscribers:
+                            app.state.event_signals.pop(run_id, None)
 
         return StreamingResponse(
             event_generator(),
@@ -292,7 +441,7 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
         if not run:
             raise HTTPException(status_code=404, detail="run not found")
         summaries = app.state.storage.list_summaries(run_id)
-        return {"summaries": summaries}
+        return _json_response({"summaries": summaries})
 
     @app.get("/meetings/{meeting_id}/runs/{run_id}/memories")
     def get_memories(meeting_id: str, run_id: str, role: Optional[str] = None):
@@ -302,8 +451,8 @@ def create_app(db_path: Path | str = "meeting.db") -> FastAPI:
             raise HTTPException(status_code=404, detail="run not found")
         if role:
             memory = app.state.storage.get_memory(run_id, role)
-            return {"role": role, "memory": memory}
+            return _json_response({"role": role, "memory": memory})
         memories = app.state.storage.list_memories(run_id)
-        return {"memories": memories}
+        return _json_response({"memories": memories})
 
     return app
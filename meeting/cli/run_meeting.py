@@ -4,27 +4,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 from pathlib import Path
 
+import orjson
+
 from meeting.domain.pause_resume import find_last_pause_token, make_resume_event
 from meeting.config import get_role_prompts
-from meeting.domain.state_machine import next_round_from_events, run_meeting
+from meeting.domain.context_builder import build_user_task
+from meeting.jsonutil import loads
+from meeting.domain.state_machine import RESUME_EVENT_TYPES, next_round_from_events, run_meeting
 from meeting.runners.langchain_runner import create_runner
 from meeting.storage.repo import StorageRepo
 
 
-def _build_user_task(config: dict) -> str:
-    # Combine topic/background/constraints into a prompt string.
-    topic = config.get("topic", "")
-    background = config.get("background", "")
-    constraints = config.get("constraints", {})
-    return f"{topic}\n{background}\n{json.dumps(constraints)}".strip()
-
-
 def _load_json(path: Path) -> dict:
     # Read JSON config files.
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads(path.read_bytes())
+
+
+# _print_json: pretty-print a JSON document to stdout.
+def _print_json(obj: dict) -> None:
+    # orjson writes UTF-8 directly, so CJK content stays readable without ensure_ascii.
+    print(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode())
 
 
 # cmd_run: CLI handler to start a run.
@@ -34,10 +35,10 @@ def cmd_run(args: argparse.Namespace) -> int:
     runner = create_runner()
     config = _load_json(Path(args.config))
     if not config.get("role_prompts"):
-        config["role_prompts"] = get_role_prompts()
+        config["role_prompts"] = dict(get_role_prompts())
     meeting_id = storage.create_meeting(config)
     run_id = storage.create_run(meeting_id, config)
-    user_task = _build_user_task(config)
+    user_task = build_user_task(config)
     result = asyncio.run(
         run_meeting(
             storage=storage,
@@ -49,7 +50,7 @@ def cmd_run(args: argparse.Namespace) -> int:
             start_round=1,
         )
     )
-    print(json.dumps({"meeting_id": meeting_id, "run_id": run_id, "result": result}, indent=2))
+    _print_json({"meeting_id": meeting_id, "run_id": run_id, "result": result})
     return 0
 
 
@@ -61,8 +62,8 @@ def cmd_resume(args: argparse.Namespace) -> int:
     run = storage.get_run(args.run_id)
     if not run:
         raise SystemExit("run not found")
-    config = json.loads(run["config_json"])
-    events = storage.list_events(args.run_id)
+    config = loads(run["config_json"])
+    events = storage.list_events(args.run_id, types=RESUME_EVENT_TYPES)
     expected = find_last_pause_token(events)
     resume_payload = _load_json(Path(args.answers))
     resume_token = resume_payload.get("resume_token")
@@ -71,18 +72,11 @@ def cmd_resume(args: argparse.Namespace) -> int:
     if expected and resume_token != expected:
         raise SystemExit("invalid resume token")
     resume_event = make_resume_event(args.run_id, resume_token, resume_payload.get("answers", {}))
-    storage.append_event_dict(
-        {
-            "type": resume_event.type,
-            "run_id": resume_event.run_id,
-            "ts_ms": resume_event.ts_ms,
-            "actor": resume_event.actor,
-            "payload": {**resume_event.payload, "event_code": "RESUMED"},
-        }
-    )
+    resume_event["payload"]["event_code"] = "RESUMED"
+    storage.append_event_dict(resume_event)
     start_round = next_round_from_events(events)
     storage.set_run_status(args.run_id, "RUNNING")
-    user_task = _build_user_task(config)
+    user_task = build_user_task(config)
     result = asyncio.run(
         run_meeting(
             storage=storage,
@@ -94,7 +88,7 @@ def cmd_resume(args: argparse.Namespace) -> int:
             start_round=start_round,
         )
     )
-    print(json.dumps({"run_id": args.run_id, "result": result}, indent=2))
+    _print_json({"run_id": args.run_id, "result": result})
     return 0
 
 
@@ -103,7 +97,7 @@ def cmd_replay(args: argparse.Namespace) -> int:
     # Print stored events for a run.
     storage = StorageRepo(Path(args.db))
     events = storage.list_events(args.run_id)
-    print(json.dumps({"run_id": args.run_id, "events": events}, indent=2))
+    _print_json({"run_id": args.run_id, "events": events})
     return 0
 
 
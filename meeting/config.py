@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 from dynaconf import Dynaconf
 
@@ -24,38 +25,46 @@ def _settings() -> Dynaconf:
     )
 
 
-def get_role_prompts() -> Dict[str, str]:
+# Getters are cached: settings are loaded once per process. Role prompts are
+# returned read-only; copy with dict(...) before storing them in a config.
+@lru_cache(maxsize=1)
+def get_role_prompts() -> Mapping[str, str]:
     settings = _settings()
     role_prompts = settings.get("role_prompts") or {}
     if hasattr(role_prompts, "items"):
-        return {str(k): str(v) for k, v in role_prompts.items()}
-    return {}
+        return MappingProxyType({str(k): str(v) for k, v in role_prompts.items()})
+    return MappingProxyType({})
 
 
+@lru_cache(maxsize=1)
 def get_system_prompt() -> str:
     settings = _settings()
     prompt = settings.get("system_prompt") or ""
     return str(prompt).strip()
 
 
+@lru_cache(maxsize=1)
 def get_recorder_output_prompt() -> str:
     settings = _settings()
     prompt = settings.get("recorder_output_prompt") or ""
     return str(prompt).strip()
 
 
+@lru_cache(maxsize=1)
 def get_role_output_prompt() -> str:
     settings = _settings()
     prompt = settings.get("role_output_prompt") or ""
     return str(prompt).strip()
 
 
+@lru_cache(maxsize=1)
 def get_role_repair_prompt() -> str:
     settings = _settings()
     prompt = settings.get("role_repair_prompt") or ""
     return str(prompt).strip()
 
 
+@lru_cache(maxsize=1)
 def get_round_summary_prompt() -> str:
     settings = _settings()
     prompt = settings.get("round_summary_prompt") or ""
@@ -4,24 +4,48 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
+
+import orjson
 
 from .models import ValidationError
 
+# Fenced ```json {...}``` block in Recorder output.
+_RECORDER_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?})\s*```", re.DOTALL)
+# raw_decode parses a JSON object in place inside free-form text and stops at its end.
+_EMBEDDED_DECODER = json.JSONDecoder()
+
+# Required keys per artifact schema (built once, not per validation call).
+_ADR_KEYS = (
+    "context",
+    "decision",
+    "alternatives_considered",
+    "consequences",
+    "risks_summary",
+    "open_questions",
+    "next_steps",
+)
+_TASK_KEYS = ("task_id", "title", "owner_role", "priority", "estimate", "dependencies")
+_RISK_KEYS = ("risk", "impact", "probability", "mitigation", "verification", "owner_role")
+_ROUND_SUMMARY_KEYS = ("round", "summary", "open_questions", "decisions", "risks", "next_steps")
+_CONSENSUS_KEYS = ("round", "votes", "winner", "rationale")
+
+# Display labels for common role names in generated flowcharts.
+_ROLE_LABELS = {
+    "Chief Architect": "首席架构师",
+    "Infra Architect": "基础设施架构师",
+    "Security Architect": "安全架构师",
+    "Skeptic": "质疑者",
+    "Recorder": "书记员",
+    "Speaker": "发言者",
+    "会议系统": "会议系统",
+}
+
 
 # validate_adr: enforce ADR schema.
 def validate_adr(content: Dict[str, Any]) -> None:
     # ADR schema validation for MVP.
-    required = [
-        "context",
-        "decision",
-        "alternatives_considered",
-        "consequences",
-        "risks_summary",
-        "open_questions",
-        "next_steps",
-    ]
-    _require_keys(content, required)
+    _require_keys(content, _ADR_KEYS)
 
 
 # validate_tasks: enforce tasks schema.
@@ -32,10 +56,7 @@ def validate_tasks(content: Dict[str, Any]) -> None:
     if not isinstance(tasks, list):
         raise ValidationError("tasks must be list")
     for task in tasks:
-        _require_keys(
-            task,
-            ["task_id", "title", "owner_role", "priority", "estimate", "dependencies"],
-        )
+        _require_keys(task, _TASK_KEYS)
 
 
 # validate_risks: enforce risks schema.
@@ -46,17 +67,7 @@ def validate_risks(content: Dict[str, Any]) -> None:
     if not isinstance(risks, list):
         raise ValidationError("risks must be list")
     for risk in risks:
-        _require_keys(
-            risk,
-            [
-                "risk",
-                "impact",
-                "probability",
-                "mitigation",
-                "verification",
-                "owner_role",
-            ],
-        )
+        _require_keys(risk, _RISK_KEYS)
 
 
 # generate_adr: minimal ADR generator for MVP.
@@ -111,9 +122,10 @@ def generate_risks() -> Dict[str, Any]:
 def parse_recorder_output(text: str) -> Dict[str, Dict[str, Any]]:
     # Parse Recorder JSON output into ADR/TASKS/RISKS dicts.
     payload = _load_recorder_json(text)
-    adr = _get_case_insensitive(payload, "ADR")
-    tasks = _get_case_insensitive(payload, "TASKS")
-    risks = _get_case_insensitive(payload, "RISKS")
+    lookup: Dict[str, Any] = {}
+    adr = _get_case_insensitive(payload, "ADR", lookup)
+    tasks = _get_case_insensitive(payload, "TASKS", lookup)
+    risks = _get_case_insensitive(payload, "RISKS", lookup)
     if not isinstance(adr, dict):
         raise ValidationError("ADR must be object")
     # Accept TASKS as list and normalize to object shape for compatibility.
@@ -128,10 +140,7 @@ def parse_recorder_output(text: str) -> Dict[str, Dict[str, Any]]:
 
 def validate_round_summary(content: Dict[str, Any]) -> None:
     # Validate per-round summary schema.
-    _require_keys(
-        content,
-        ["round", "summary", "open_questions", "decisions", "risks", "next_steps"],
-    )
+    _require_keys(content, _ROUND_SUMMARY_KEYS)
     if not isinstance(content["round"], int):
         raise ValidationError("round must be int")
     if not isinstance(content["summary"], str):
@@ -153,7 +162,7 @@ def parse_round_summary_output(text: str, round_index: int) -> Dict[str, Any]:
 
 def validate_consensus(content: Dict[str, Any]) -> None:
     # Validate consensus artifact schema.
-    _require_keys(content, ["round", "votes", "winner", "rationale"])
+    _require_keys(content, _CONSENSUS_KEYS)
     if not isinstance(content["round"], int):
         raise ValidationError("round must be int")
     if not isinstance(content["votes"], dict):
@@ -168,29 +177,21 @@ def generate_flowchart(roles: List[str], rounds: int) -> Dict[str, Any]:
     # Generate a Mermaid sequence diagram for the completed meeting.
     safe_rounds = max(1, int(rounds))
     speaker_roles = list(roles) if roles else ["Speaker"]
-    used_roles: List[str] = []
-    for idx in range(1, safe_rounds + 1):
-        role = speaker_roles[(idx - 1) % len(speaker_roles)]
-        if role not in used_roles:
-            used_roles.append(role)
-    participants = ["会议系统"] + used_roles
+    round_speakers = [speaker_roles[(idx - 1) % len(speaker_roles)] for idx in range(1, safe_rounds + 1)]
+    participants = ["会议系统"] + list(dict.fromkeys(round_speakers))
     if "Recorder" not in participants:
         participants.append("Recorder")
 
-    alias_map: Dict[str, str] = {}
+    alias_map = {role: f"p{idx}" for idx, role in enumerate(participants)}
     lines: List[str] = ["sequenceDiagram", "  autonumber"]
-
-    for idx, role in enumerate(participants):
-        alias = f"p{idx}"
-        alias_map[role] = alias
-        label = _role_label(role)
-        lines.append(f'  participant {alias} as "{label}"')
+    lines.extend(
+        f'  participant p{idx} as "{_role_label(role)}"' for idx, role in enumerate(participants)
+    )
 
     system_alias = alias_map["会议系统"]
     recorder_alias = alias_map.get("Recorder", alias_map[participants[-1]])
 
-    for idx in range(1, safe_rounds + 1):
-        role = speaker_roles[(idx - 1) % len(speaker_roles)]
+    for idx, role in enumerate(round_speakers, start=1):
         speaker_alias = alias_map[role]
         lines.append(f"  {system_alias}->>{speaker_alias}: 第{idx}轮 发言")
         lines.append(f"  {speaker_alias}-->>{system_alias}: 第{idx}轮 结论")
@@ -200,7 +201,7 @@ def generate_flowchart(roles: List[str], rounds: int) -> Dict[str, Any]:
     return {"mermaid": "\n".join(lines), "rounds": safe_rounds, "roles": roles}
 
 
-def _require_keys(data: Dict[str, Any], keys: List[str]) -> None:
+def _require_keys(data: Dict[str, Any], keys: Sequence[str]) -> None:
     # Shared helper for schema checks.
     for key in keys:
         if key not in data:
@@ -215,24 +216,25 @@ def _require_list(value: Any, name: str) -> None:
 
 def _role_label(role: str) -> str:
     # Map common role names to Chinese labels for display.
-    mapping = {
-        "Chief Architect": "首席架构师",
-        "Infra Architect": "基础设施架构师",
-        "Security Architect": "安全架构师",
-        "Skeptic": "质疑者",
-        "Recorder": "书记员",
-        "Speaker": "发言者",
-        "会议系统": "会议系统",
-    }
-    return mapping.get(role, str(role))
+    return _ROLE_LABELS.get(role, str(role))
 
 
-def _get_case_insensitive(data: Dict[str, Any], key: str) -> Any:
-    # Fetch a value by case-insensitive key match.
+def _get_case_insensitive(
+    data: Dict[str, Any],
+    key: str,
+    lookup: Dict[str, Any] | None = None,
+) -> Any:
+    # Fetch a value by case-insensitive key match; exact and lowercase keys skip the scan.
     if key in data:
         return data[key]
-    lookup = {str(k).lower(): v for k, v in data.items()}
     lowered = key.lower()
+    if lowered in data:
+        return data[lowered]
+    # Mixed-case keys: build the lowercase map once, shared via `lookup` across calls.
+    if lookup is None:
+        lookup = {}
+    if not lookup:
+        lookup.update((str(k).lower(), v) for k, v in data.items())
     if lowered in lookup:
         return lookup[lowered]
     raise ValidationError(f"missing key: {key}")
@@ -242,10 +244,9 @@ def _load_recorder_json(text: str) -> Dict[str, Any]:
     # Extract and parse JSON from Recorder output text.
     if not text:
         raise ValidationError("recorder output is empty")
-    match = re.search(r"```(?:json)?\s*(\{.*?})\s*```", text, flags=re.DOTALL)
-    json_text = match.group(1) if match else _extract_json_object(text)
+    match = _RECORDER_JSON_RE.search(text) if "```" in text else None
     try:
-        payload = json.loads(json_text)
+        payload = orjson.loads(match.group(1)) if match else _decode_json_object(text)
     except json.JSONDecodeError as exc:
         raise ValidationError("recorder output is not valid JSON") from exc
     if not isinstance(payload, dict):
@@ -253,31 +254,10 @@ def _load_recorder_json(text: str) -> Dict[str, Any]:
     return payload
 
 
-def _extract_json_object(text: str) -> str:
-    # Extract the first top-level JSON object from free-form text.
+def _decode_json_object(text: str) -> Dict[str, Any]:
+    # Decode the JSON object starting at the first "{"; text after it is ignored.
     start = text.find("{")
     if start == -1:
         raise ValidationError("no JSON object found")
-    depth = 0
-    in_string = False
-    escape = False
-    for idx in range(start, len(text)):
-        ch = text[idx]
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
-        if ch == '"':
-            in_string = True
-            continue
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start : idx + 1]
-    raise ValidationError("unterminated JSON object")
+    payload, _ = _EMBEDDED_DECODER.raw_decode(text, start)
+    return payload
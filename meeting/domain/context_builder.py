@@ -4,9 +4,23 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+from meeting.jsonutil import dumps
+
 from .models import ExecutionContext, Message
 
 
+# build_user_task: merge topic/background/constraints into the runner task prompt.
+def build_user_task(config: Dict[str, Any]) -> str:
+    # Empty parts are skipped so an empty constraints dict adds no "{}" to the prompt.
+    topic = config.get("topic") or ""
+    background = config.get("background") or ""
+    constraints = config.get("constraints") or {}
+    parts = [topic, background]
+    if constraints:
+        parts.append(dumps(constraints).decode())
+    return "\n".join(part for part in parts if part).strip()
+
+
 # build_shared_context: assemble shared context for runner input.
 def build_shared_context(
     meeting_id: str,
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import secrets
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, TypedDict, get_args
 
 
 Role = Literal["system", "user", "assistant", "tool"]
@@ -31,19 +32,32 @@ ArtifactType = Literal[
 ]
 ContextMode = Literal["shared", "layered"]
 
+# Membership sets for the validators, derived from the Literal types above so
+# each allowed value is defined once.
+_ROLES = frozenset(get_args(Role))
+_EVENT_TYPES = frozenset(get_args(EventType))
+_ARTIFACT_TYPES = frozenset(get_args(ArtifactType))
+_CONTEXT_MODES = frozenset(get_args(ContextMode))
+
 
 class ValidationError(ValueError):
     # Raised when a protocol payload fails validation.
     pass
 
 
+# new_id: opaque random id shared by messages, events and resume tokens.
+def new_id(prefix: str) -> str:
+    # 128 random bits, hex encoded, after a type prefix such as "msg".
+    return f"{prefix}-{secrets.token_hex(16)}"
+
+
 def _require(condition: bool, message: str) -> None:
-    # Minimal helper to keep validators readable.
+    # Minimal helper for ad-hoc checks; the validators below inline it to skip the call.
     if not condition:
         raise ValidationError(message)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     role: Role
     content: str
@@ -52,7 +66,7 @@ class Message:
     meta: Optional[Dict[str, Any]] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Event:
     type: EventType
     run_id: str
@@ -61,7 +75,16 @@ class Event:
     payload: Dict[str, Any]
 
 
-@dataclass(frozen=True)
+class EventDict(TypedDict):
+    # Plain-dict form of Event, as written by StorageRepo.append_event_dict.
+    type: EventType
+    run_id: str
+    ts_ms: int
+    actor: str
+    payload: Dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class Artifact:
     run_id: str
     type: ArtifactType
@@ -70,7 +93,7 @@ class Artifact:
     created_ts_ms: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class ExecutionContext:
     meeting_id: str
     run_id: str
@@ -86,60 +109,65 @@ class ExecutionContext:
 
 def validate_message_dict(data: Dict[str, Any]) -> None:
     # Ensure incoming message payload matches the stable protocol.
-    _require("role" in data, "message.role is required")
-    _require("content" in data, "message.content is required")
-    _require(data["role"] in {"system", "user", "assistant", "tool"}, "invalid message.role")
-    _require(isinstance(data["content"], str) and data["content"], "message.content must be non-empty string")
+    if "role" not in data:
+        raise ValidationError("message.role is required")
+    if "content" not in data:
+        raise ValidationError("message.content is required")
+    if data["role"] not in _ROLES:
+        raise ValidationError("invalid message.role")
+    if not (isinstance(data["content"], str) and data["content"]):
+        raise ValidationError("message.content must be non-empty string")
 
 
 def validate_event_dict(data: Dict[str, Any]) -> None:
     # Validate event payloads used for replay and audit.
-    _require("type" in data, "event.type is required")
-    _require("run_id" in data, "event.run_id is required")
-    _require("ts_ms" in data, "event.ts_ms is required")
-    _require("actor" in data, "event.actor is required")
-    _require("payload" in data, "event.payload is required")
-    _require(
-        data["type"]
-        in {
-            "round_started",
-            "speaker_selected",
-            "token",
-            "agent_message",
-            "summary_written",
-            "artifact_written",
-            "pause",
-            "resume",
-            "metric",
-            "error",
-            "finished",
-        },
-        "invalid event.type",
-    )
-    _require(isinstance(data["payload"], dict), "event.payload must be dict")
+    if "type" not in data:
+        raise ValidationError("event.type is required")
+    if "run_id" not in data:
+        raise ValidationError("event.run_id is required")
+    if "ts_ms" not in data:
+        raise ValidationError("event.ts_ms is required")
+    if "actor" not in data:
+        raise ValidationError("event.actor is required")
+    if "payload" not in data:
+        raise ValidationError("event.payload is required")
+    if data["type"] not in _EVENT_TYPES:
+        raise ValidationError("invalid event.type")
+    if not isinstance(data["payload"], dict):
+        raise ValidationError("event.payload must be dict")
 
 
 def validate_artifact_dict(data: Dict[str, Any]) -> None:
     # Validate artifact payloads before storage or output.
-    _require("run_id" in data, "artifact.run_id is required")
-    _require("type" in data, "artifact.type is required")
-    _require("version" in data, "artifact.version is required")
-    _require("content" in data, "artifact.content is required")
-    _require(
-        data["type"]
-        in {"ADR", "TASKS", "RISKS", "MINUTES", "SUMMARY", "FLOWCHART", "CONSENSUS"},
-        "invalid artifact.type",
-    )
-    _require(isinstance(data["content"], dict), "artifact.content must be dict")
+    if "run_id" not in data:
+        raise ValidationError("artifact.run_id is required")
+    if "type" not in data:
+        raise ValidationError("artifact.type is required")
+    if "version" not in data:
+        raise ValidationError("artifact.version is required")
+    if "content" not in data:
+        raise ValidationError("artifact.content is required")
+    if data["type"] not in _ARTIFACT_TYPES:
+        raise ValidationError("invalid artifact.type")
+    if not isinstance(data["content"], dict):
+        raise ValidationError("artifact.content must be dict")
 
 
 def validate_execution_context(ctx: ExecutionContext) -> None:
     # Guard rails for Runner inputs.
-    _require(bool(ctx.meeting_id), "meeting_id is required")
-    _require(bool(ctx.run_id), "run_id is required")
-    _require(ctx.round >= 1, "round must be >= 1")
-    _require(bool(ctx.speaker), "speaker is required")
-    _require(ctx.context_mode in {"shared", "layered"}, "invalid context_mode")
-    _require(isinstance(ctx.public_messages, list), "public_messages must be list")
-    _require(isinstance(ctx.private_memory, dict), "private_memory must be dict")
-    _require(isinstance(ctx.limits, dict), "limits must be dict")
+    if not ctx.meeting_id:
+        raise ValidationError("meeting_id is required")
+    if not ctx.run_id:
+        raise ValidationError("run_id is required")
+    if ctx.round < 1:
+        raise ValidationError("round must be >= 1")
+    if not ctx.speaker:
+        raise ValidationError("speaker is required")
+    if ctx.context_mode not in _CONTEXT_MODES:
+        raise ValidationError("invalid context_mode")
+    if not isinstance(ctx.public_messages, list):
+        raise ValidationError("public_messages must be list")
+    if not isinstance(ctx.private_memory, dict):
+        raise ValidationError("private_memory must be dict")
+    if not isinstance(ctx.limits, dict):
+        raise ValidationError("limits must be dict")
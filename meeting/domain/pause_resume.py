@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import uuid
+import time
 from typing import Any, Dict, List, Optional
 
-from .models import Event
+from .models import EventDict, new_id
 
 
 # create_resume_token: generate an opaque token for resume validation.
 def create_resume_token() -> str:
     # Generate an opaque token to correlate resume requests.
-    return f"resume-{uuid.uuid4().hex}"
+    return new_id("resume")
 
 
 # make_pause_event: build a pause event with missing-info questions.
@@ -20,15 +20,15 @@ def make_pause_event(
     reason: str,
     questions: List[Dict[str, Any]],
     actor: str = "system",
-) -> Event:
-    # Pause event captures missing info and questions.
+) -> EventDict:
+    # Pause event captures missing info and questions; a plain dict ready for storage.
     payload = {
         "pause_reason": reason,
         "questions": questions,
         "resume_token": create_resume_token(),
         "suggested_next": "answer_questions",
     }
-    return Event(type="pause", run_id=run_id, ts_ms=_now_ms(), actor=actor, payload=payload)
+    return {"type": "pause", "run_id": run_id, "ts_ms": _now_ms(), "actor": actor, "payload": payload}
 
 
 # make_resume_event: build a resume event carrying user answers.
@@ -37,13 +37,13 @@ def make_resume_event(
     resume_token: str,
     answers: Dict[str, Any],
     actor: str = "user",
-) -> Event:
+) -> EventDict:
     # Resume event carries the user's answers for re-entry.
     payload = {
         "resume_token": resume_token,
         "answers": answers,
     }
-    return Event(type="resume", run_id=run_id, ts_ms=_now_ms(), actor=actor, payload=payload)
+    return {"type": "resume", "run_id": run_id, "ts_ms": _now_ms(), "actor": actor, "payload": payload}
 
 
 # find_last_pause_token: get the most recent pause token from events.
@@ -51,12 +51,11 @@ def find_last_pause_token(events: List[Dict[str, Any]]) -> Optional[str]:
     # Look backward for the latest pause token.
     for event in reversed(events):
         if event.get("type") == "pause":
-            return event.get("payload", {}).get("resume_token")
+            payload = event.get("payload")
+            return payload.get("resume_token") if payload else None
     return None
 
 
 def _now_ms() -> int:
-    # Millisecond timestamp for events.
-    import time
-
-    return int(time.time() * 1000)
+    # Millisecond timestamp for events (integer math, no float rounding).
+    return time.time_ns() // 1_000_000
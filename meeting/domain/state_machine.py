@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import time
+from collections import deque
 from typing import Any, Dict, List
 
+import orjson
+
 from .artifacts import (
     generate_adr,
     generate_flowchart,
@@ -35,9 +38,7 @@ from .validators import parse_and_validate_role_output
 
 def _now_ms() -> int:
     # Millisecond timestamp for events.
-    import time
-
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def _message_from_dict(data: Dict[str, Any]) -> Message:
@@ -51,6 +52,10 @@ def _message_from_dict(data: Dict[str, Any]) -> Message:
     )
 
 
+# Event types that contribute to the shared public context.
+_PUBLIC_EVENT_TYPES = ("agent_message", "resume")
+
+
 def _public_messages_from_events(events: List[Dict[str, Any]]) -> List[Message]:
     # Build the shared context from stored events.
     messages: List[Message] = []
@@ -83,23 +88,15 @@ def _event_dict(
     payload: Dict[str, Any],
 ) -> Dict[str, Any]:
     # Standardize event dicts written to storage.
-    event_payload = dict(payload)
-    if "event_code" not in event_payload:
-        event_payload["event_code"] = _event_code_for_event(event_type, event_payload, actor)
-    return {
-        "type": event_type,
-        "run_id": run_id,
-        "ts_ms": _now_ms(),
-        "actor": actor,
-        "payload": event_payload,
-    }
-
-
-def _select_speaker(roles: List[str], round_index: int) -> str:
-    # Round-robin speaker selection.
-    if not roles:
-        return "Speaker"
-    return roles[(round_index - 1) % len(roles)]
+    return _attach_event_code(
+        {
+            "type": event_type,
+            "run_id": run_id,
+            "ts_ms": _now_ms(),
+            "actor": actor,
+            "payload": payload,
+        }
+    )
 
 
 def _select_parallel_speakers(
@@ -129,6 +126,21 @@ def _select_parallel_speakers(
     return base_roles, "parallel_all"
 
 
+# PRD event codes for event types whose code does not depend on the payload.
+_EVENT_CODES = {
+    "round_started": "ROUND_STARTED",
+    "speaker_selected": "SPEAKER_SELECTED",
+    "token": "AGENT_TOKEN",
+    "summary_written": "SUMMARY_WRITTEN",
+    "artifact_written": "ARTIFACT_WRITTEN",
+    "pause": "PAUSED",
+    "resume": "RESUMED",
+    "metric": "METRIC_EMITTED",
+    "error": "ERROR",
+    "finished": "MEETING_FINISHED",
+}
+
+
 def _event_code_for_event(event_type: str, payload: Dict[str, Any], actor: str) -> str:
     # Map internal event types to PRD-friendly event codes.
     if event_type == "agent_message":
@@ -136,23 +148,17 @@ def _event_code_for_event(event_type: str, payload: Dict[str, Any], actor: str)
         if actor == "user" or role == "user":
             return "USER_MESSAGE_ADDED"
         return "AGENT_OUTPUT"
-    mapping = {
-        "round_started": "ROUND_STARTED",
-        "speaker_selected": "SPEAKER_SELECTED",
-        "token": "AGENT_TOKEN",
-        "summary_written": "SUMMARY_WRITTEN",
-        "artifact_written": "ARTIFACT_WRITTEN",
-        "pause": "PAUSED",
-        "resume": "RESUMED",
-        "metric": "METRIC_EMITTED",
-        "error": "ERROR",
-        "finished": "MEETING_FINISHED",
-    }
-    return mapping.get(event_type, event_type.upper())
+    return _EVENT_CODES.get(event_type) or event_type.upper()
+
+
+def _artifact_event_payload(artifact_type: str, version: str) -> Dict[str, Any]:
+    # artifact_written payload minus content, which storage splices in from the artifact row.
+    return {"artifact_type": artifact_type, "version": version, "event_code": _EVENT_CODES["artifact_written"]}
 
 
 def _attach_event_code(event_dict: Dict[str, Any]) -> Dict[str, Any]:
-    # Ensure payload has event_code for downstream tooling.
+    # Ensure payload has event_code for downstream tooling. The code goes on a copy:
+    # runner events and caller payloads may still be referenced elsewhere.
     payload = event_dict.get("payload") or {}
     if "event_code" not in payload:
         payload = dict(payload)
@@ -161,7 +167,7 @@ def _attach_event_code(event_dict: Dict[str, Any]) -> Dict[str, Any]:
             payload,
             event_dict.get("actor", ""),
         )
-        event_dict["payload"] = payload
+    event_dict["payload"] = payload
     return event_dict
 
 
@@ -195,28 +201,21 @@ def _compute_consensus(outputs: Dict[str, Dict[str, Any]]) -> tuple[Dict[str, in
         votes[key] = votes.get(key, 0) + 1
     if not votes:
         return {}, "", 0.0
-    ranked = sorted(votes.items(), key=lambda item: (-item[1], item[0]))
-    winner = ranked[0][0]
-    total = sum(votes.values())
-    consensus_score = votes[winner] / total if total else 0.0
-    return votes, winner, consensus_score
+    # Most votes wins; ties go to the lexicographically smallest decision.
+    winner, top = min(votes.items(), key=lambda item: (-item[1], item[0]))
+    return votes, winner, top / sum(votes.values())
 
 
 def _summary_to_message(summary: Dict[str, Any]) -> Message:
     # Convert summary dict into a public Message for layered context.
-    text = json.dumps(summary, ensure_ascii=False)
+    text = orjson.dumps(summary).decode()
     return Message(role="system", content=f"round_summary: {text}", name="summary")
 
 
-def _summaries_to_messages(
-    summaries: List[Dict[str, Any]],
-    keep_last: int,
-) -> List[Message]:
-    # Convert latest summaries into Messages.
-    if keep_last <= 0:
-        return []
-    trimmed = summaries[-keep_last:]
-    return [_summary_to_message(summary) for summary in trimmed]
+def _trim_public_messages(messages: List[Message], max_items: int) -> None:
+    # Drop the oldest public messages in place; contexts hold the same list object.
+    if max_items > 0 and len(messages) > max_items:
+        del messages[:-max_items]
 
 
 def _normalize_memory(memory: Dict[str, Any] | None) -> Dict[str, Any]:
@@ -238,37 +237,62 @@ def _normalize_memory(memory: Dict[str, Any] | None) -> Dict[str, Any]:
     return merged
 
 
-def _trim_list(items: List[Any], max_items: int) -> List[Any]:
-    # Trim a list to the latest N items.
-    if max_items <= 0:
-        return []
-    if len(items) <= max_items:
-        return items
-    return items[-max_items:]
-
-
 def _merge_memory(
     memory: Dict[str, Any] | None,
     role_output: Dict[str, Any],
     max_items: int,
 ) -> Dict[str, Any]:
-    # Merge role output into private memory snapshot.
-    merged = _normalize_memory(memory)
-    merged["assumptions"] += role_output.get("assumptions", [])
-    merged["pending_checks"] += role_output.get("questions", [])
-    merged["risks_pool"] += role_output.get("risks", [])
+    # Merge role output into private memory snapshot, keeping the latest max_items per list.
+    maxlen = max(0, max_items)
+    merged = {key: deque(items, maxlen=maxlen) for key, items in _normalize_memory(memory).items()}
+    merged["assumptions"].extend(role_output.get("assumptions", ()))
+    merged["pending_checks"].extend(role_output.get("questions", ()))
+    merged["risks_pool"].extend(role_output.get("risks", ()))
     proposal = role_output.get("proposal")
     if proposal:
         merged["drafts"].append(str(proposal))
     decision = role_output.get("decision_recommendation")
     if decision:
         merged["notes"].append(str(decision))
-    for tradeoff in role_output.get("tradeoffs", []):
+    for tradeoff in role_output.get("tradeoffs", ()):
         if tradeoff:
             merged["notes"].append(str(tradeoff))
-    for key in merged:
-        merged[key] = _trim_list(merged[key], max_items)
-    return merged
+    return {key: list(items) for key, items in merged.items()}
+
+
+# Streamed tokens are written in batches: at most _TOKEN_FLUSH_MAX per write, and no
+# token waits longer than _TOKEN_FLUSH_SECONDS for its batch to reach storage.
+_TOKEN_FLUSH_MAX = 32
+_TOKEN_FLUSH_SECONDS = 0.05
+
+
+class _TokenBuffer:
+    # Collects one speaker turn's token events and writes them with append_events_bulk.
+    def __init__(self, storage) -> None:
+        self._storage = storage
+        self._events: List[Dict[str, Any]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    def add(self, event_dict: Dict[str, Any]) -> None:
+        # Buffer a token; flush when full, otherwise make sure a flush is scheduled.
+        self._events.append(event_dict)
+        if len(self._events) >= _TOKEN_FLUSH_MAX:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(_TOKEN_FLUSH_SECONDS, self.flush)
+
+    def flush(self) -> None:
+        # Write whatever is buffered and cancel the pending timer.
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._events:
+            events, self._events = self._events, []
+            self._storage.append_events_bulk(events)
+
+
+# User task for the single repair retry after a role output fails validation.
+_REPAIR_USER_TASK = "{user_task}\n\n请将以下输出修复为严格 JSON：\n{previous_output}"
 
 
 async def _run_speaker_turn(
@@ -314,21 +338,32 @@ async def _run_speaker_turn(
 
     last_message: str | None = None
     parsed_output: Dict[str, Any] | None = None
-    async for event in runner.run(ctx):
-        event_dict = {
-            "type": event.type,
-            "run_id": event.run_id,
-            "ts_ms": event.ts_ms,
-            "actor": event.actor,
-            "payload": event.payload,
-        }
-        storage.append_event_dict(_attach_event_code(event_dict))
-        if event.type == "agent_message":
-            msg = event.payload.get("message")
-            if isinstance(msg, dict):
-                if capture_public:
-                    public_messages.append(_message_from_dict(msg))
-                last_message = str(msg.get("content", ""))
+    tokens = _TokenBuffer(storage)
+    try:
+        async for event in runner.run(ctx):
+            event_dict = _attach_event_code(
+                {
+                    "type": event.type,
+                    "run_id": event.run_id,
+                    "ts_ms": event.ts_ms,
+                    "actor": event.actor,
+                    "payload": event.payload,
+                }
+            )
+            if event.type == "token":
+                tokens.add(event_dict)
+                continue
+            # Buffered tokens go first so stored order matches stream order.
+            tokens.flush()
+            storage.append_event_dict(event_dict)
+            if event.type == "agent_message":
+                msg = event.payload.get("message")
+                if isinstance(msg, dict):
+                    if capture_public:
+                        public_messages.append(_message_from_dict(msg))
+                    last_message = str(msg.get("content", ""))
+    finally:
+        tokens.flush()
     try:
         if last_message and limits.get("validate_role_output"):
             parsed_output = parse_and_validate_role_output(last_message)
@@ -351,8 +386,8 @@ async def _run_speaker_turn(
             repair_prompt = ""
         if repair_prompt:
             repair_system_text = "\n".join([system_text, repair_prompt]).strip()
-            repair_user_task = (
-                f"{user_task}\n\n请将以下输出修复为严格 JSON：\n{last_message}"
+            repair_user_task = _REPAIR_USER_TASK.format(
+                user_task=user_task, previous_output=last_message
             )
             limits_retry = dict(limits)
             limits_retry["validate_role_output"] = True
@@ -376,6 +411,65 @@ async def _run_speaker_turn(
     return last_message, parsed_output
 
 
+async def _run_round_summary(
+    storage,
+    runner,
+    meeting_id: str,
+    run_id: str,
+    round_index: int,
+    public_messages: List[Message],
+    summary_messages: List[Message],
+    system_text: str,
+    user_task: str,
+    limits: Dict[str, Any],
+) -> Dict[str, Any] | None:
+    # Ask the Recorder for a structured round summary; persist and return it.
+    summary_text, _ = await _run_speaker_turn(
+        storage=storage,
+        runner=runner,
+        meeting_id=meeting_id,
+        run_id=run_id,
+        round_index=round_index,
+        speaker="Recorder",
+        public_messages=public_messages,
+        summary_messages=summary_messages,
+        private_memory={},
+        system_text=system_text,
+        user_task=f"{user_task}\n\n请总结第{round_index}轮。",
+        limits=limits,
+        context_mode="shared",
+        capture_public=False,
+    )
+    if not summary_text:
+        return None
+    try:
+        summary = parse_round_summary_output(summary_text, round_index)
+        storage.save_artifacts_with_events(
+            run_id,
+            "recorder",
+            [
+                (
+                    "SUMMARY",
+                    "v2",
+                    summary,
+                    "summary_written",
+                    {"round": round_index, "event_code": _EVENT_CODES["summary_written"]},
+                )
+            ],
+        )
+    except Exception as exc:
+        storage.append_event_dict(
+            _event_dict(
+                "error",
+                run_id,
+                "recorder",
+                {"message": str(exc), "stage": "round_summary"},
+            )
+        )
+        return None
+    return summary
+
+
 # run_meeting: orchestrate rounds, persist events, and generate artifacts.
 async def run_meeting(
     storage,
@@ -405,74 +499,84 @@ async def run_meeting(
     )
 
     # Resume from existing events if any.
-    events = storage.list_events(run_id)
+    events = storage.list_events(run_id, types=_PUBLIC_EVENT_TYPES)
     public_messages = _public_messages_from_events(events)
     limits_base = dict(config.get("limits", {}))
+    # Public messages kept in memory; keep it at or above every history_max_messages.
+    public_history_max = int(limits_base.get("public_history_max_messages", 200))
+    _trim_public_messages(public_messages, public_history_max)
     if "roles" not in limits_base:
         limits_base["roles"] = roles
     limits_base.setdefault("validate_role_output", True)
     limits_base.setdefault("role_repair_prompt", role_repair_prompt)
+    # Round-robin order; a meeting without roles still gets a generic speaker.
+    round_robin: List[str] = list(roles) or ["Speaker"]
+    # Per-role system text and limits are fixed for the run; build them once.
+    role_setups: Dict[str, tuple[str, Dict[str, Any]]] = {}
+    for role_name in round_robin:
+        role_text = role_prompts.get(role_name, f"你是{role_name}。")
+        system_text = f"{system_prompt}\n{role_text}".strip() if system_prompt else role_text
+        role_limits = dict(limits_base)
+        if role_name.lower() == "recorder":
+            role_limits["validate_role_output"] = False
+        elif role_output_prompt:
+            system_text = "\n".join([system_text, role_output_prompt]).strip()
+        role_setups[role_name] = (system_text, role_limits)
     last_round = start_round - 1
     latest_role_outputs: Dict[str, Dict[str, Any]] = {}
     summary_keep_last = int(config.get("summary_keep_last", 3))
     memory_max_items = int(config.get("memory_max_items", 50))
-    summary_history: List[Dict[str, Any]] = []
-    if context_mode == "layered":
-        stored = storage.list_summaries(run_id)
-        summary_history = [item["content"] for item in stored if "content" in item]
-    summary_messages = _summaries_to_messages(summary_history, summary_keep_last)
+    # Each summary is encoded once; the deque keeps only the newest keep_last messages.
+    summary_window: deque[Message] = deque(maxlen=max(0, summary_keep_last))
+    if context_mode == "layered" and summary_keep_last > 0:
+        stored = storage.list_summaries(run_id, limit=summary_keep_last)
+        summary_window.extend(_summary_to_message(item["content"]) for item in stored)
+    summary_messages = list(summary_window)
 
     for round_index in range(start_round, max_rounds + 1):
         round_outputs: Dict[str, Dict[str, Any]] = {}
-        speakers: List[str]
+        speakers: List[str] = []
         strategy = "round_robin"
         if parallel_mode:
             speakers, strategy = _select_parallel_speakers(roles, round_index, config)
-            if not speakers:
-                speakers = [_select_speaker(roles, round_index)]
-                strategy = "round_robin"
-        else:
-            speakers = [_select_speaker(roles, round_index)]
+        if not speakers:
+            speakers = [round_robin[(round_index - 1) % len(round_robin)]]
+            strategy = "round_robin"
         last_round = round_index
 
         # Record round start and speaker selection.
-        storage.append_event_dict(
-            _event_dict(
-                "round_started",
-                run_id,
-                "orchestrator",
-                {"round": round_index, "mode": "parallel" if parallel_mode else "sequential"},
-            )
-        )
-        storage.append_event_dict(
-            _event_dict(
-                "speaker_selected",
-                run_id,
-                "orchestrator",
-                {
-                    "speaker": speakers[0] if len(speakers) == 1 else None,
-                    "speakers": speakers,
-                    "round": round_index,
-                    "strategy": strategy,
-                },
-            )
+        storage.append_events_bulk(
+            [
+                _event_dict(
+                    "round_started",
+                    run_id,
+                    "orchestrator",
+                    {"round": round_index, "mode": "parallel" if parallel_mode else "sequential"},
+                ),
+                _event_dict(
+                    "speaker_selected",
+                    run_id,
+                    "orchestrator",
+                    {
+                        "speaker": speakers[0] if len(speakers) == 1 else None,
+                        "speakers": speakers,
+                        "round": round_index,
+                        "strategy": strategy,
+                    },
+                ),
+            ]
         )
 
         async def _run_role(role_name: str):
-            role_text = role_prompts.get(role_name, f"你是{role_name}。")
-            system_text = f"{system_prompt}\n{role_text}".strip() if system_prompt else role_text
-            limits = dict(limits_base)
-            if role_name.lower() != "recorder" and role_output_prompt:
-                system_text = "\n".join([system_text, role_output_prompt]).strip()
-            if role_name.lower() == "recorder":
-                limits["validate_role_output"] = False
-
+            system_text, role_limits = role_setups[role_name]
             private_memory = {}
+            has_memory = False
             if context_mode == "layered":
                 stored_memory = storage.get_memory(run_id, role_name)
                 private_memory = _normalize_memory(stored_memory)
+                has_memory = stored_memory is not None
 
-            return await _run_speaker_turn(
+            result = await _run_speaker_turn(
                 storage=storage,
                 runner=runner,
                 meeting_id=meeting_id,
@@ -484,33 +588,30 @@ async def run_meeting(
                 private_memory=private_memory,
                 system_text=system_text,
                 user_task=user_task,
-                limits=limits,
+                limits=dict(role_limits),
                 context_mode=context_mode,
             )
+            return result, private_memory, has_memory
 
         if parallel_mode and len(speakers) > 1:
             results = await asyncio.gather(*[_run_role(s) for s in speakers])
-            for role_name, result in zip(speakers, results):
-                _, parsed_output = result
-                if parsed_output:
-                    latest_role_outputs[role_name] = parsed_output
-                    round_outputs[role_name] = parsed_output
-                    if context_mode == "layered" and role_name.lower() != "recorder":
-                        stored_memory = storage.get_memory(run_id, role_name)
-                        private_memory = _normalize_memory(stored_memory)
-                        updated_memory = _merge_memory(private_memory, parsed_output, memory_max_items)
-                        storage.upsert_memory(run_id, role_name, updated_memory)
         else:
-            role_name = speakers[0]
-            _, parsed_output = await _run_role(role_name)
-            if parsed_output:
-                latest_role_outputs[role_name] = parsed_output
-                round_outputs[role_name] = parsed_output
-                if context_mode == "layered" and role_name.lower() != "recorder":
-                    stored_memory = storage.get_memory(run_id, role_name)
-                    private_memory = _normalize_memory(stored_memory)
-                    updated_memory = _merge_memory(private_memory, parsed_output, memory_max_items)
-                    storage.upsert_memory(run_id, role_name, updated_memory)
+            results = [await _run_role(speakers[0])]
+        _trim_public_messages(public_messages, public_history_max)
+        # Merge into the memory each role was given for its turn; one write per round.
+        memory_updates: List[tuple[str, Dict[str, Any]]] = []
+        for role_name, ((_, parsed_output), private_memory, has_memory) in zip(speakers, results):
+            if not parsed_output:
+                continue
+            latest_role_outputs[role_name] = parsed_output
+            round_outputs[role_name] = parsed_output
+            if context_mode == "layered" and role_name.lower() != "recorder":
+                updated_memory = _merge_memory(private_memory, parsed_output, memory_max_items)
+                # Every role that speaks gets a first snapshot; after that, an output
+                # that adds nothing leaves the latest snapshot as is.
+                if not has_memory or updated_memory != private_memory:
+                    memory_updates.append((role_name, updated_memory))
+        storage.upsert_memories_bulk(run_id, memory_updates)
 
         # Optional pause hook for demo/testing.
         pause_on_round = config.get("pause_on_round")
@@ -520,67 +621,33 @@ async def run_meeting(
                 reason="missing_info",
                 questions=[{"key": "qps", "ask": "Peak QPS?", "why": "capacity depends", "required": True}],
             )
-            storage.append_event_dict(
-                _attach_event_code(
-                    {
-                        "type": pause_event.type,
-                        "run_id": pause_event.run_id,
-                        "ts_ms": pause_event.ts_ms,
-                        "actor": pause_event.actor,
-                        "payload": pause_event.payload,
-                    }
-                )
-            )
+            storage.append_event_dict(_attach_event_code(pause_event))
             storage.set_run_status(run_id, "PAUSED")
             return {"status": "PAUSED"}
 
         if context_mode == "layered" and round_summary_prompt:
+            # Awaited here: the next round's layered speakers read this summary.
             recorder_role_text = role_prompts.get("Recorder", "你是Recorder。")
             summary_system_text = "\n".join(
                 text for text in [system_prompt, recorder_role_text, round_summary_prompt] if text
             ).strip()
             summary_limits = dict(limits_base)
             summary_limits["validate_role_output"] = False
-            summary_text, _ = await _run_speaker_turn(
+            summary = await _run_round_summary(
                 storage=storage,
                 runner=runner,
                 meeting_id=meeting_id,
                 run_id=run_id,
                 round_index=round_index,
-                speaker="Recorder",
                 public_messages=public_messages,
                 summary_messages=summary_messages,
-                private_memory={},
                 system_text=summary_system_text,
-                user_task=f"{user_task}\n\n请总结第{round_index}轮。",
+                user_task=user_task,
                 limits=summary_limits,
-                context_mode="shared",
-                capture_public=False,
             )
-            summary_text = summary_text or ""
-            if summary_text:
-                try:
-                    summary = parse_round_summary_output(summary_text, round_index)
-                    storage.save_artifact(run_id, "SUMMARY", "v2", summary)
-                    storage.append_event_dict(
-                        _event_dict(
-                            "summary_written",
-                            run_id,
-                            "recorder",
-                            {"round": round_index, "content": summary},
-                        )
-                    )
-                    summary_history.append(summary)
-                    summary_messages = _summaries_to_messages(summary_history, summary_keep_last)
-                except Exception as exc:
-                    storage.append_event_dict(
-                        _event_dict(
-                            "error",
-                            run_id,
-                            "recorder",
-                            {"message": str(exc), "stage": "round_summary"},
-                        )
-                    )
+            if summary:
+                summary_window.append(_summary_to_message(summary))
+                summary_messages = list(summary_window)
 
         consensus_score = None
         vote_counts = None
@@ -593,14 +660,10 @@ async def run_meeting(
                 "rationale": "多数票收敛" if winner else "无有效投票",
             }
             validate_consensus(consensus)
-            storage.save_artifact(run_id, "CONSENSUS", "v1", consensus)
-            storage.append_event_dict(
-                _event_dict(
-                    "artifact_written",
-                    run_id,
-                    "orchestrator",
-                    {"artifact_type": "CONSENSUS", "version": "v1", "content": consensus},
-                )
+            storage.save_artifacts_with_events(
+                run_id,
+                "orchestrator",
+                [("CONSENSUS", "v1", consensus, "artifact_written", _artifact_event_payload("CONSENSUS", "v1"))],
             )
 
         # Stop decision based on thresholds and observed convergence.
@@ -678,43 +741,20 @@ async def run_meeting(
     validate_tasks(tasks)
     validate_risks(risks)
 
-    storage.save_artifact(run_id, "ADR", "v1", adr)
-    storage.save_artifact(run_id, "TASKS", "v1", tasks)
-    storage.save_artifact(run_id, "RISKS", "v1", risks)
     flowchart = generate_flowchart(roles, last_round)
-    storage.save_artifact(run_id, "FLOWCHART", "v1", flowchart)
-
-    storage.append_event_dict(
-        _event_dict(
-            "artifact_written",
-            run_id,
-            "recorder",
-            {"artifact_type": "ADR", "version": "v1", "content": adr},
-        )
-    )
-    storage.append_event_dict(
-        _event_dict(
-            "artifact_written",
-            run_id,
-            "recorder",
-            {"artifact_type": "TASKS", "version": "v1", "content": tasks},
-        )
-    )
-    storage.append_event_dict(
-        _event_dict(
-            "artifact_written",
-            run_id,
-            "recorder",
-            {"artifact_type": "RISKS", "version": "v1", "content": risks},
-        )
-    )
-    storage.append_event_dict(
-        _event_dict(
-            "artifact_written",
-            run_id,
-            "recorder",
-            {"artifact_type": "FLOWCHART", "version": "v1", "content": flowchart},
-        )
+    final_artifacts = [
+        ("ADR", "v1", adr),
+        ("TASKS", "v1", tasks),
+        ("RISKS", "v1", risks),
+        ("FLOWCHART", "v1", flowchart),
+    ]
+    storage.save_artifacts_with_events(
+        run_id,
+        "recorder",
+        [
+            (artifact_type, version, content, "artifact_written", _artifact_event_payload(artifact_type, version))
+            for artifact_type, version, content in final_artifacts
+        ],
     )
 
     # Mark run as completed.
@@ -725,6 +765,10 @@ async def run_meeting(
     }
 
 
+# Event types that next_round_from_events and find_last_pause_token read.
+RESUME_EVENT_TYPES = ("round_started", "pause")
+
+
 # next_round_from_events: compute resume start round.
 def next_round_from_events(events: List[Dict[str, Any]]) -> int:
     # Find the next round index for resume.
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TerminationConfig:
     # Thresholds that control early stop vs. max rounds.
     max_rounds: int = 6
@@ -25,13 +25,11 @@ def should_stop(
     # Stop on max rounds, valid artifacts, or low disagreement/questions.
     if round_index < config.min_rounds:
         return False
-    if round_index >= config.max_rounds:
-        return True
-    if artifacts_valid:
-        return True
-    if open_questions <= config.open_questions_max and disagreements <= config.disagreements_max:
-        return True
-    return False
+    return (
+        round_index >= config.max_rounds
+        or artifacts_valid
+        or (open_questions <= config.open_questions_max and disagreements <= config.disagreements_max)
+    )
 
 
 # metrics: emit convergence counters for event stream.
@@ -4,10 +4,29 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
+
+import orjson
 
 from .models import ValidationError
 
+# Required role output keys per the PRD (built once, not per validation call).
+_ROLE_OUTPUT_KEYS = (
+    "assumptions",
+    "proposal",
+    "tradeoffs",
+    "risks",
+    "questions",
+    "decision_recommendation",
+)
+_ROLE_OUTPUT_LIST_KEYS = ("assumptions", "tradeoffs", "questions", "risks")
+_ROLE_RISK_KEYS = ("risk", "impact", "mitigation", "verification")
+
+# Fenced ```json {...}``` block in role output.
+_ROLE_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?})\s*```", re.DOTALL)
+# raw_decode parses a JSON object in place inside free-form text and stops at its end.
+_EMBEDDED_DECODER = json.JSONDecoder()
+
 
 def parse_and_validate_role_output(text: str) -> Dict[str, Any]:
     # Parse JSON text and validate required role output fields.
@@ -18,28 +37,16 @@ def parse_and_validate_role_output(text: str) -> Dict[str, Any]:
 
 def validate_role_output(payload: Dict[str, Any]) -> None:
     # Enforce role output schema required by the PRD.
-    _require_keys(
-        payload,
-        [
-            "assumptions",
-            "proposal",
-            "tradeoffs",
-            "risks",
-            "questions",
-            "decision_recommendation",
-        ],
-    )
-    _require_list(payload["assumptions"], "assumptions")
-    _require_list(payload["tradeoffs"], "tradeoffs")
-    _require_list(payload["questions"], "questions")
-    _require_list(payload["risks"], "risks")
+    _require_keys(payload, _ROLE_OUTPUT_KEYS)
+    for name in _ROLE_OUTPUT_LIST_KEYS:
+        _require_list(payload[name], name)
     for risk in payload["risks"]:
         if not isinstance(risk, dict):
             raise ValidationError("risks entries must be objects")
-        _require_keys(risk, ["risk", "impact", "mitigation", "verification"])
+        _require_keys(risk, _ROLE_RISK_KEYS)
 
 
-def _require_keys(data: Dict[str, Any], keys: list[str]) -> None:
+def _require_keys(data: Dict[str, Any], keys: Sequence[str]) -> None:
     # Shared helper for required keys.
     for key in keys:
         if key not in data:
@@ -56,10 +63,9 @@ def _load_json(text: str) -> Dict[str, Any]:
     # Extract JSON from text and parse it into a dict.
     if not text:
         raise ValidationError("role output is empty")
-    match = re.search(r"```(?:json)?\s*(\{.*?})\s*```", text, flags=re.DOTALL)
-    json_text = match.group(1) if match else _extract_json_object(text)
+    match = _ROLE_JSON_RE.search(text) if "```" in text else None
     try:
-        payload = json.loads(json_text)
+        payload = orjson.loads(match.group(1)) if match else _decode_json_object(text)
     except json.JSONDecodeError as exc:
         raise ValidationError("role output is not valid JSON") from exc
     if not isinstance(payload, dict):
@@ -67,31 +73,10 @@ def _load_json(text: str) -> Dict[str, Any]:
     return payload
 
 
-def _extract_json_object(text: str) -> str:
-    # Extract the first top-level JSON object from free-form text.
+def _decode_json_object(text: str) -> Dict[str, Any]:
+    # Decode the JSON object starting at the first "{"; text after it is ignored.
     start = text.find("{")
     if start == -1:
         raise ValidationError("no JSON object found")
-    depth = 0
-    in_string = False
-    escape = False
-    for idx in range(start, len(text)):
-        ch = text[idx]
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
-        if ch == '"':
-            in_string = True
-            continue
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start : idx + 1]
-    raise ValidationError("unterminated JSON object")
+    payload, _ = _EMBEDDED_DECODER.raw_decode(text, start)
+    return payload
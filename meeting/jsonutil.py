@@ -0,0 +1,27 @@
+"""JSON encode/decode helpers: orjson first, stdlib json for what orjson rejects."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import orjson
+
+
+# dumps: encode to compact UTF-8 JSON bytes.
+def dumps(value: Any) -> bytes:
+    # orjson, allowing non-str dict keys; stdlib json still writes what orjson rejects
+    # (integers past 64 bits), so such data keeps encoding as it did before orjson.
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+# loads: decode JSON text or bytes.
+def loads(data: str | bytes) -> Any:
+    # orjson, with stdlib json for input it rejects (NaN/Infinity written by json.dumps).
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
-import uuid
+import time
 from typing import Any, AsyncIterator, List
 
-from meeting.domain.models import Event, ExecutionContext, Message
+import orjson
+
+from meeting.domain.models import Event, ExecutionContext, new_id
 
 try:
     from langchain_core.messages import (
@@ -36,9 +37,7 @@ def _load_dotenv_if_available() -> None:
 
 def _now_ms() -> int:
     # Millisecond timestamp for event payloads.
-    import time
-
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def _build_prompt(ctx: ExecutionContext) -> List[BaseMessage]:
@@ -53,7 +52,7 @@ def _build_prompt(ctx: ExecutionContext) -> List[BaseMessage]:
     system_text = ctx.system_instructions or f"你是{ctx.speaker}。"
     memory_text = ""
     if ctx.context_mode == "layered" and ctx.private_memory:
-        memory_text = f"私有记忆:\n{json.dumps(ctx.private_memory, ensure_ascii=False)}\n\n"
+        memory_text = f"私有记忆:\n{orjson.dumps(ctx.private_memory).decode()}\n\n"
     user_text = (
         f"公共摘要:\n{history}\n\n"
         f"{memory_text}"
@@ -86,45 +85,45 @@ def _normalize_base_url(base_url: str) -> str:
     return f"{base}/v1"
 
 
+def _agent_message_event(ctx: ExecutionContext, message_id: str, content: str) -> Event:
+    # Final agent_message for a turn; the message is built as the dict stored in the payload.
+    ts_ms = _now_ms()
+    return Event(
+        type="agent_message",
+        run_id=ctx.run_id,
+        ts_ms=ts_ms,
+        actor=f"agent:{ctx.speaker}",
+        payload={
+            "message": {
+                "role": "assistant",
+                "content": content,
+                "name": ctx.speaker,
+                "ts_ms": ts_ms,
+                "meta": None,
+            },
+            "message_id": message_id,
+            "round": ctx.round,
+        },
+    )
+
+
 class StubGroupChatRunner:
     async def run(self, ctx: ExecutionContext) -> AsyncIterator[Event]:
         # Deterministic placeholder runner for local/dev.
-        message_id = f"msg-{uuid.uuid4().hex}"
+        message_id = new_id("msg")
+        actor = f"agent:{ctx.speaker}"
         tokens = ["正在", "思考", "方案..."]
         for token in tokens:
             yield Event(
                 type="token",
                 run_id=ctx.run_id,
                 ts_ms=_now_ms(),
-                actor=f"agent:{ctx.speaker}",
+                actor=actor,
                 payload={"text": token, "message_id": message_id, "role": ctx.speaker},
             )
             await asyncio.sleep(0)
 
-        message = Message(
-            role="assistant",
-            content=f"[{ctx.speaker}] 回复: {ctx.user_task}",
-            name=ctx.speaker,
-            ts_ms=_now_ms(),
-            meta=None,
-        )
-        yield Event(
-            type="agent_message",
-            run_id=ctx.run_id,
-            ts_ms=_now_ms(),
-            actor=f"agent:{ctx.speaker}",
-            payload={
-                "message": {
-                    "role": message.role,
-                    "content": message.content,
-                    "name": message.name,
-                    "ts_ms": message.ts_ms,
-                    "meta": message.meta,
-                },
-                "message_id": message_id,
-                "round": ctx.round,
-            },
-        )
+        yield _agent_message_event(ctx, message_id, f"[{ctx.speaker}] 回复: {ctx.user_task}")
 
 
 class LangChainGroupChatRunner:
@@ -160,7 +159,11 @@ class LangChainGroupChatRunner:
 
     # run: execute a single speaker turn via LangChain.
     async def run(self, ctx: ExecutionContext) -> AsyncIterator[Event]:
-        message_id = f"msg-{uuid.uuid4().hex}"
+        message_id = new_id("msg")
+        # Token events share everything but ts_ms and text; build the constant parts once.
+        actor = f"agent:{ctx.speaker}"
+        run_id = ctx.run_id
+        speaker = ctx.speaker
         prompt = _build_prompt(ctx)
         content_parts: List[str] = []
 
@@ -173,10 +176,10 @@ class LangChainGroupChatRunner:
                 content_parts.append(text)
                 yield Event(
                     type="token",
-                    run_id=ctx.run_id,
+                    run_id=run_id,
                     ts_ms=_now_ms(),
-                    actor=f"agent:{ctx.speaker}",
-                    payload={"text": text, "message_id": message_id, "role": ctx.speaker},
+                    actor=actor,
+                    payload={"text": text, "message_id": message_id, "role": speaker},
                 )
         except Exception:
             content_parts = []
@@ -194,30 +197,7 @@ class LangChainGroupChatRunner:
                 "(should include /v1 for most OpenAI-compatible services)."
             ) from exc
 
-        message = Message(
-            role="assistant",
-            content=final_text,
-            name=ctx.speaker,
-            ts_ms=_now_ms(),
-            meta=None,
-        )
-        yield Event(
-            type="agent_message",
-            run_id=ctx.run_id,
-            ts_ms=_now_ms(),
-            actor=f"agent:{ctx.speaker}",
-            payload={
-                "message": {
-                    "role": message.role,
-                    "content": message.content,
-                    "name": message.name,
-                    "ts_ms": message.ts_ms,
-                    "meta": message.meta,
-                },
-                "message_id": message_id,
-                "round": ctx.round,
-            },
-        )
+        yield _agent_message_event(ctx, message_id, final_text)
 
 
 # create_runner: select stub vs. langchain runner.
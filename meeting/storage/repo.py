@@ -2,53 +2,118 @@
 
 from __future__ import annotations
 
-import json
+import logging
+import queue
 import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from meeting.jsonutil import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# INSERTs used by several write paths; sqlite3 caches the prepared statement per SQL text.
+_INSERT_EVENT_SQL = "INSERT INTO events (run_id, ts_ms, type, actor, payload_json) VALUES (?, ?, ?, ?, ?)"
+_INSERT_ARTIFACT_SQL = (
+    "INSERT INTO artifacts (run_id, type, version, content_json, created_ts_ms) VALUES (?, ?, ?, ?, ?)"
+)
+_INSERT_MEMORY_SQL = "INSERT INTO memories (run_id, role_name, content_json, updated_ts_ms) VALUES (?, ?, ?, ?)"
 
 
 def _now_ms() -> int:
     # Consistent millisecond timestamps for storage rows.
-    import time
-
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 class StorageRepo:
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, read_pool_size: int = 4):
         # Initialize and ensure schema exists.
+        if str(db_path) == ":memory:":
+            # Each connection would open its own empty in-memory database.
+            raise ValueError("StorageRepo needs a database file, not ':memory:'")
         self.db_path = Path(db_path)
+        self._event_listeners: List[Callable[[str], None]] = []
+        # Writes share one connection behind a lock; reads draw from a pool so
+        # concurrent endpoints (WAL mode) do not block each other.
+        self._write_conn = self._connect()
+        self._write_lock = threading.Lock()
         self._init_schema()
+        self._read_pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        # Guards _closed against readers being returned while close() drains the pool.
+        self._pool_lock = threading.Lock()
+        self._closed = False
+        for _ in range(max(1, read_pool_size)):
+            self._read_pool.put(self._connect())
 
     def _connect(self) -> sqlite3.Connection:
-        # Open a new SQLite connection with row access by name.
-        conn = sqlite3.connect(self.db_path)
+        # Open a SQLite connection usable from any thread, with row access by name.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Sorts and temp indices for the list queries stay off disk.
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
 
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        # Borrow a pooled read connection for the duration of the block.
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                if self._closed:
+                    # Borrowed while close() ran; it was not in the pool to be closed.
+                    conn.close()
+                else:
+                    self._read_pool.put(conn)
+
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        # Serialize writes on the shared connection; commit or roll back on exit.
+        with self._write_lock, self._write_conn as conn:
+            yield conn
+
     def _init_schema(self) -> None:
         # Create tables if they do not exist.
         schema_path = Path(__file__).with_name("schema.sql")
         schema = schema_path.read_text(encoding="utf-8")
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.executescript(schema)
 
+    # close: release the writer and every pooled reader connection.
+    def close(self) -> None:
+        # Close connections; the repo must not be used afterwards.
+        with self._write_lock:
+            self._write_conn.close()
+        with self._pool_lock:
+            self._closed = True
+            while True:
+                try:
+                    self._read_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
     # create_meeting: insert a meeting row and return id.
     def create_meeting(self, config: Dict[str, Any]) -> str:
         # Persist a new meeting record.
         meeting_id = f"m-{_now_ms()}"
         title = config.get("title", "")
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.execute(
                 "INSERT INTO meetings (id, title, config_json, created_at) VALUES (?, ?, ?, ?)",
-                (meeting_id, title, json.dumps(config), _now_ms()),
+                (meeting_id, title, dumps(config).decode(), _now_ms()),
             )
         return meeting_id
 
     def get_meeting(self, meeting_id: str) -> Optional[Dict[str, Any]]:
         # Fetch a meeting by id.
-        with self._connect() as conn:
+        with self._reader() as conn:
             row = conn.execute("SELECT * FROM meetings WHERE id = ?", (meeting_id,)).fetchone()
         if not row:
             return None
@@ -56,7 +121,7 @@ class StorageRepo:
 
     # list_meetings: list recent meetings.
     def list_meetings(self, limit: int = 100) -> List[Dict[str, Any]]:
-        with self._connect() as conn:
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT * FROM meetings ORDER BY created_at DESC LIMIT ?",
                 (limit,),
@@ -67,16 +132,16 @@ class StorageRepo:
     def create_run(self, meeting_id: str, config: Dict[str, Any]) -> str:
         # Persist a new run for a meeting.
         run_id = f"r-{_now_ms()}"
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.execute(
                 "INSERT INTO runs (id, meeting_id, status, config_json, started_at, ended_at) VALUES (?, ?, ?, ?, ?, ?)",
-                (run_id, meeting_id, "RUNNING", json.dumps(config), _now_ms(), None),
+                (run_id, meeting_id, "RUNNING", dumps(config).decode(), _now_ms(), None),
             )
         return run_id
 
     def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
         # Fetch a run by id.
-        with self._connect() as conn:
+        with self._reader() as conn:
             row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
         if not row:
             return None
@@ -84,7 +149,7 @@ class StorageRepo:
 
     # list_runs: list runs, optionally filtered by meeting_id.
     def list_runs(self, limit: int = 100, meeting_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        with self._connect() as conn:
+        with self._reader() as conn:
             if meeting_id:
                 rows = conn.execute(
                     "SELECT * FROM runs WHERE meeting_id = ? ORDER BY started_at DESC LIMIT ?",
@@ -100,58 +165,134 @@ class StorageRepo:
     def set_run_status(self, run_id: str, status: str) -> None:
         # Update status and ended_at for terminal states.
         ended_at = _now_ms() if status in {"DONE", "FAILED"} else None
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.execute(
                 "UPDATE runs SET status = ?, ended_at = ? WHERE id = ?",
                 (status, ended_at, run_id),
             )
 
+    # add_event_listener: register a callback invoked with run_id after each event append.
+    def add_event_listener(self, listener: Callable[[str], None]) -> None:
+        # Lets the API wake stream subscribers instead of polling the table.
+        self._event_listeners.append(listener)
+
+    def _notify_listeners(self, run_id: str) -> None:
+        # The rows are already committed; a failing listener must not surface as a failed write.
+        for listener in self._event_listeners:
+            try:
+                listener(run_id)
+            except Exception:
+                logger.exception("event listener failed for run %s", run_id)
+
     # append_event_dict: append-only event write.
     def append_event_dict(self, event: Dict[str, Any]) -> None:
         # Append-only event storage.
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.execute(
-                "INSERT INTO events (run_id, ts_ms, type, actor, payload_json) VALUES (?, ?, ?, ?, ?)",
+                _INSERT_EVENT_SQL,
                 (
                     event.get("run_id"),
                     event.get("ts_ms"),
                     event.get("type"),
                     event.get("actor"),
-                    json.dumps(event.get("payload", {})),
+                    dumps(event.get("payload", {})).decode(),
                 ),
             )
+        self._notify_listeners(event.get("run_id"))
 
-    # list_events: ordered replay of events.
-    def list_events(self, run_id: str) -> List[Dict[str, Any]]:
-        # Ordered event replay for a run.
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT run_id, ts_ms, type, actor, payload_json FROM events WHERE run_id = ? ORDER BY id",
-                (run_id,),
-            ).fetchall()
+    # append_events_bulk: append several events in one transaction.
+    def append_events_bulk(self, events: List[Dict[str, Any]]) -> None:
+        # One executemany/commit for events emitted back to back; listeners fire once per run.
+        if not events:
+            return
+        rows = [
+            (
+                event.get("run_id"),
+                event.get("ts_ms"),
+                event.get("type"),
+                event.get("actor"),
+                dumps(event.get("payload", {})).decode(),
+            )
+            for event in events
+        ]
+        with self._writer() as conn:
+            conn.executemany(
+                _INSERT_EVENT_SQL,
+                rows,
+            )
+        for run_id in dict.fromkeys(row[0] for row in rows):
+            self._notify_listeners(run_id)
+
+    # list_events: ordered replay of events, optionally filtered by type.
+    def list_events(self, run_id: str, types: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        # Ordered event replay for a run, optionally only the given event types.
+        query = "SELECT run_id, ts_ms, type, actor, payload_json FROM events WHERE run_id = ?"
+        params: List[Any] = [run_id]
+        order_by = "id"
+        if types:
+            query += f" AND type IN ({', '.join('?' * len(types))})"
+            params.extend(types)
+            # "+id" keeps SQLite from walking idx_events_run_id just to skip the sort;
+            # idx_events_run_type then reads only the matching rows.
+            order_by = "+id"
+        with self._reader() as conn:
+            rows = conn.execute(f"{query} ORDER BY {order_by}", params).fetchall()
         events: List[Dict[str, Any]] = []
+        # Event types are interned so long replays share one string per type and
+        # equality checks against literals hit the identity fast path.
         for row in rows:
-            payload = json.loads(row["payload_json"])
+            payload = loads(row["payload_json"])
             events.append(
                 {
                     "run_id": row["run_id"],
                     "ts_ms": row["ts_ms"],
-                    "type": row["type"],
+                    "type": sys.intern(row["type"]),
                     "actor": row["actor"],
                     "payload": payload,
                 }
             )
         return events
 
+    # iter_events: ordered replay in row-id pages, optionally without token events.
+    def iter_events(
+        self,
+        run_id: str,
+        include_tokens: bool = True,
+        batch_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        # Page by row id so exports never hold the whole run in memory.
+        token_filter = "" if include_tokens else "AND type != 'token' "
+        after_id = 0
+        while True:
+            with self._reader() as conn:
+                rows = conn.execute(
+                    "SELECT id, run_id, ts_ms, type, actor, payload_json "
+                    f"FROM events WHERE run_id = ? AND id > ? {token_filter}ORDER BY id LIMIT ?",
+                    (run_id, after_id, batch_size),
+                ).fetchall()
+            for row in rows:
+                yield {
+                    "run_id": row["run_id"],
+                    "ts_ms": row["ts_ms"],
+                    "type": sys.intern(row["type"]),
+                    "actor": row["actor"],
+                    "payload": loads(row["payload_json"]),
+                }
+            if len(rows) < batch_size:
+                return
+            after_id = rows[-1]["id"]
+
     # list_event_rows_after: fetch events after a given row id (for streaming).
     def list_event_rows_after(
         self,
         run_id: str,
         after_id: int,
         limit: int = 200,
+        decode_payload: bool = True,
     ) -> List[Dict[str, Any]]:
-        # Incremental event loading for SSE streams.
-        with self._connect() as conn:
+        # Incremental event loading for SSE streams; with decode_payload=False rows
+        # carry the stored "payload_json" text instead of a parsed "payload".
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT id, run_id, ts_ms, type, actor, payload_json "
                 "FROM events WHERE run_id = ? AND id > ? ORDER BY id LIMIT ?",
@@ -159,22 +300,29 @@ class StorageRepo:
             ).fetchall()
         events: List[Dict[str, Any]] = []
         for row in rows:
-            events.append(
-                {
-                    "id": row["id"],
-                    "run_id": row["run_id"],
-                    "ts_ms": row["ts_ms"],
-                    "type": row["type"],
-                    "actor": row["actor"],
-                    "payload": json.loads(row["payload_json"]),
-                }
-            )
+            event = {
+                "id": row["id"],
+                "run_id": row["run_id"],
+                "ts_ms": row["ts_ms"],
+                "type": sys.intern(row["type"]),
+                "actor": row["actor"],
+            }
+            if decode_payload:
+                event["payload"] = loads(row["payload_json"])
+            else:
+                event["payload_json"] = row["payload_json"]
+            events.append(event)
         return events
 
     # list_recent_event_rows: fetch latest events with ids for bootstrapping streams.
-    def list_recent_event_rows(self, run_id: str, limit: int = 200) -> List[Dict[str, Any]]:
-        # Load the most recent events for an SSE tail.
-        with self._connect() as conn:
+    def list_recent_event_rows(
+        self,
+        run_id: str,
+        limit: int = 200,
+        decode_payload: bool = True,
+    ) -> List[Dict[str, Any]]:
+        # Load the most recent events for an SSE tail (decode_payload as above).
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT id, run_id, ts_ms, type, actor, payload_json "
                 "FROM events WHERE run_id = ? ORDER BY id DESC LIMIT ?",
@@ -182,31 +330,65 @@ class StorageRepo:
             ).fetchall()
         events: List[Dict[str, Any]] = []
         for row in reversed(rows):
-            events.append(
-                {
-                    "id": row["id"],
-                    "run_id": row["run_id"],
-                    "ts_ms": row["ts_ms"],
-                    "type": row["type"],
-                    "actor": row["actor"],
-                    "payload": json.loads(row["payload_json"]),
-                }
-            )
+            event = {
+                "id": row["id"],
+                "run_id": row["run_id"],
+                "ts_ms": row["ts_ms"],
+                "type": sys.intern(row["type"]),
+                "actor": row["actor"],
+            }
+            if decode_payload:
+                event["payload"] = loads(row["payload_json"])
+            else:
+                event["payload_json"] = row["payload_json"]
+            events.append(event)
         return events
 
     # save_artifact: persist a structured artifact.
     def save_artifact(self, run_id: str, artifact_type: str, version: str, content: Dict[str, Any]) -> None:
         # Persist a structured artifact.
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.execute(
-                "INSERT INTO artifacts (run_id, type, version, content_json, created_ts_ms) VALUES (?, ?, ?, ?, ?)",
-                (run_id, artifact_type, version, json.dumps(content), _now_ms()),
+                _INSERT_ARTIFACT_SQL,
+                (run_id, artifact_type, version, dumps(content).decode(), _now_ms()),
             )
 
+    # save_artifacts_with_events: persist artifacts and the events announcing them together.
+    def save_artifacts_with_events(
+        self,
+        run_id: str,
+        actor: str,
+        artifacts: List[tuple[str, str, Any, str, Dict[str, Any]]],
+    ) -> None:
+        # Each item is (artifact_type, version, content, event_type, event_payload). Content is
+        # encoded once and spliced into the event payload as its trailing "content" key.
+        if not artifacts:
+            return
+        created_ts_ms = _now_ms()
+        artifact_rows = []
+        event_rows = []
+        for artifact_type, version, content, event_type, event_payload in artifacts:
+            content_json = dumps(content)
+            head = dumps(event_payload)[:-1]
+            separator = b"," if len(head) > 1 else b""
+            artifact_rows.append((run_id, artifact_type, version, content_json.decode(), created_ts_ms))
+            payload_json = b'%b%b"content":%b}' % (head, separator, content_json)
+            event_rows.append((run_id, created_ts_ms, event_type, actor, payload_json.decode()))
+        with self._writer() as conn:
+            conn.executemany(
+                _INSERT_ARTIFACT_SQL,
+                artifact_rows,
+            )
+            conn.executemany(
+                _INSERT_EVENT_SQL,
+                event_rows,
+            )
+        self._notify_listeners(run_id)
+
     # list_artifacts: load artifacts for output.
     def list_artifacts(self, run_id: str) -> List[Dict[str, Any]]:
         # Load artifacts for response payloads.
-        with self._connect() as conn:
+        with self._reader() as conn:
             rows = conn.execute(
                 "SELECT run_id, type, version, content_json, created_ts_ms FROM artifacts WHERE run_id = ? ORDER BY id",
                 (run_id,),
@@ -218,20 +400,35 @@ class StorageRepo:
                     "run_id": row["run_id"],
                     "type": row["type"],
                     "version": row["version"],
-                    "content": json.loads(row["content_json"]),
+                    "content": loads(row["content_json"]),
                     "created_ts_ms": row["created_ts_ms"],
                 }
             )
         return artifacts
 
-    def list_summaries(self, run_id: str, version: str = "v2") -> List[Dict[str, Any]]:
-        # Load round summaries for a run.
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT run_id, type, version, content_json, created_ts_ms "
-                "FROM artifacts WHERE run_id = ? AND type = ? AND version = ? ORDER BY created_ts_ms",
-                (run_id, "SUMMARY", version),
-            ).fetchall()
+    def list_summaries(
+        self,
+        run_id: str,
+        version: str = "v2",
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        # Load round summaries for a run, oldest first; limit keeps only the newest ones.
+        query = (
+            "SELECT run_id, type, version, content_json, created_ts_ms "
+            "FROM artifacts WHERE run_id = ? AND type = ? AND version = ? "
+        )
+        with self._reader() as conn:
+            if limit is None:
+                rows = conn.execute(
+                    f"{query}ORDER BY created_ts_ms, id",
+                    (run_id, "SUMMARY", version),
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"{query}ORDER BY created_ts_ms DESC, id DESC LIMIT ?",
+                    (run_id, "SUMMARY", version, limit),
+                ).fetchall()
+                rows.reverse()
         summaries: List[Dict[str, Any]] = []
         for row in rows:
             summaries.append(
@@ -239,7 +436,7 @@ class StorageRepo:
                     "run_id": row["run_id"],
                     "type": row["type"],
                     "version": row["version"],
-                    "content": json.loads(row["content_json"]),
+                    "content": loads(row["content_json"]),
                     "created_ts_ms": row["created_ts_ms"],
                 }
             )
@@ -247,48 +444,63 @@ class StorageRepo:
 
     def get_memory(self, run_id: str, role_name: str) -> Optional[Dict[str, Any]]:
         # Fetch the latest memory snapshot for a role.
-        with self._connect() as conn:
+        with self._reader() as conn:
             row = conn.execute(
                 "SELECT content_json FROM memories WHERE run_id = ? AND role_name = ? "
-                "ORDER BY updated_ts_ms DESC LIMIT 1",
+                "ORDER BY updated_ts_ms DESC, id DESC LIMIT 1",
                 (run_id, role_name),
             ).fetchone()
         if not row:
             return None
-        return json.loads(row["content_json"])
+        return loads(row["content_json"])
 
     def list_memories(self, run_id: str) -> List[Dict[str, Any]]:
-        # Load latest memory snapshots per role.
-        with self._connect() as conn:
+        # Load latest memory snapshots per role; SQLite picks one row per role.
+        with self._reader() as conn:
             rows = conn.execute(
-                "SELECT role_name, content_json, updated_ts_ms FROM memories WHERE run_id = ? "
-                "ORDER BY updated_ts_ms DESC",
+                "SELECT role_name, content_json, updated_ts_ms FROM ("
+                "SELECT id, role_name, content_json, updated_ts_ms, ROW_NUMBER() OVER ("
+                "PARTITION BY role_name ORDER BY updated_ts_ms DESC, id DESC) AS rank "
+                "FROM memories WHERE run_id = ?"
+                ") WHERE rank = 1 ORDER BY updated_ts_ms DESC, id DESC",
                 (run_id,),
             ).fetchall()
-        latest: Dict[str, Dict[str, Any]] = {}
-        for row in rows:
-            role = row["role_name"]
-            if role in latest:
-                continue
-            latest[role] = {
-                "role_name": role,
-                "content": json.loads(row["content_json"]),
+        return [
+            {
+                "role_name": row["role_name"],
+                "content": loads(row["content_json"]),
                 "updated_ts_ms": row["updated_ts_ms"],
             }
-        return list(latest.values())
+            for row in rows
+        ]
 
     def upsert_memory(self, run_id: str, role_name: str, content: Dict[str, Any]) -> None:
         # Append a new memory snapshot for the role.
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.execute(
-                "INSERT INTO memories (run_id, role_name, content_json, updated_ts_ms) VALUES (?, ?, ?, ?)",
-                (run_id, role_name, json.dumps(content), _now_ms()),
+                _INSERT_MEMORY_SQL,
+                (run_id, role_name, dumps(content).decode(), _now_ms()),
+            )
+
+    # upsert_memories_bulk: append memory snapshots for several roles in one transaction.
+    def upsert_memories_bulk(self, run_id: str, items: List[tuple[str, Dict[str, Any]]]) -> None:
+        # Each item is (role_name, content), as for upsert_memory.
+        if not items:
+            return
+        updated_ts_ms = _now_ms()
+        with self._writer() as conn:
+            conn.executemany(
+                _INSERT_MEMORY_SQL,
+                [
+                    (run_id, role_name, dumps(content).decode(), updated_ts_ms)
+                    for role_name, content in items
+                ],
             )
 
     def save_memory(self, run_id: str, role_name: str, content: Dict[str, Any]) -> None:
         # Placeholder for layered context storage.
-        with self._connect() as conn:
+        with self._writer() as conn:
             conn.execute(
-                "INSERT INTO memories (run_id, role_name, content_json, updated_ts_ms) VALUES (?, ?, ?, ?)",
-                (run_id, role_name, json.dumps(content), _now_ms()),
+                _INSERT_MEMORY_SQL,
+                (run_id, role_name, dumps(content).decode(), _now_ms()),
             )
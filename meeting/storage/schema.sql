@@ -41,6 +41,10 @@ CREATE TABLE IF NOT EXISTS memories (
 );
 
 CREATE INDEX IF NOT EXISTS idx_events_run_id ON events (run_id);
+CREATE INDEX IF NOT EXISTS idx_events_run_type ON events (run_id, type);
 CREATE INDEX IF NOT EXISTS idx_artifacts_run_id ON artifacts (run_id);
+CREATE INDEX IF NOT EXISTS idx_artifacts_run_type_version ON artifacts (run_id, type, version, created_ts_ms);
 CREATE INDEX IF NOT EXISTS idx_memories_run_id ON memories (run_id);
-CREATE INDEX IF NOT EXISTS idx_memories_run_role ON memories (run_id, role_name);
+DROP INDEX IF EXISTS idx_memories_run_role;
+CREATE INDEX IF NOT EXISTS idx_memories_run_role_updated ON memories (run_id, role_name, updated_ts_ms);
+CREATE INDEX IF NOT EXISTS idx_runs_meeting_started ON runs (meeting_id, started_at);
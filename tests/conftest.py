@@ -184,4 +184,6 @@ def client(app):
 def storage(sqlite_path):
     from meeting.storage.repo import StorageRepo
 
-    return StorageRepo(sqlite_path)
+    repo = StorageRepo(sqlite_path)
+    yield repo
+    repo.close()
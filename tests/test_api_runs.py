@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+from fastapi.testclient import TestClient
+
+from meeting.api import server
+from meeting.storage.repo import StorageRepo
+
+
+class BlockingRunner:
+    async def run(self, ctx):
+        await asyncio.sleep(3600)
+        yield
+
+
+def _create_meeting(client):
+    response = client.post("/meetings", json={"topic": "cache", "roles": ["Chief Architect"], "max_rounds": 1})
+    return response.json()["meeting_id"]
+
+
+def _wait_for_status(client, meeting_id, run_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        run = client.get(f"/meetings/{meeting_id}/runs/{run_id}").json()
+        if run["run"]["status"] != "RUNNING" or time.monotonic() > deadline:
+            return run
+        time.sleep(0.02)
+
+
+def test_start_run_returns_before_the_run_finishes(monkeypatch, sqlite_path):
+    monkeypatch.setenv("MEETING_RUNNER", "stub")
+    app = server.create_app(sqlite_path)
+
+    with TestClient(app) as client:
+        meeting_id = _create_meeting(client)
+        started = client.post(f"/meetings/{meeting_id}/runs").json()
+        assert started["status"] == "RUNNING"
+
+        run = _wait_for_status(client, meeting_id, started["run_id"])
+        assert run["run"]["status"] == "DONE"
+        assert {artifact["type"] for artifact in run["artifacts"]} >= {"ADR", "TASKS", "RISKS", "FLOWCHART"}
+
+
+def test_shutdown_cancels_runs_after_the_drain_timeout(monkeypatch, sqlite_path):
+    monkeypatch.setenv("MEETING_RUNNER", "stub")
+    monkeypatch.setattr(server, "_SHUTDOWN_DRAIN_S", 0.05)
+    app = server.create_app(sqlite_path)
+    app.state.runner = BlockingRunner()
+
+    started_at = time.monotonic()
+    with TestClient(app) as client:
+        meeting_id = _create_meeting(client)
+        run_id = client.post(f"/meetings/{meeting_id}/runs").json()["run_id"]
+
+    assert time.monotonic() - started_at < 5
+    assert app.state.run_tasks == {}
+    repo = StorageRepo(sqlite_path)
+    try:
+        assert repo.get_run(run_id)["status"] == "FAILED"
+    finally:
+        repo.close()
+
+
+def test_resume_rejects_a_run_that_is_still_running(monkeypatch, sqlite_path):
+    monkeypatch.setenv("MEETING_RUNNER", "stub")
+    monkeypatch.setattr(server, "_SHUTDOWN_DRAIN_S", 0.05)
+    app = server.create_app(sqlite_path)
+    app.state.runner = BlockingRunner()
+
+    with TestClient(app) as client:
+        meeting_id = _create_meeting(client)
+        run_id = client.post(f"/meetings/{meeting_id}/runs").json()["run_id"]
+
+        response = client.post(f"/meetings/{meeting_id}/runs/{run_id}/resume", json={"resume_token": "x"})
+
+        assert response.status_code == 409
+        events = client.get(f"/meetings/{meeting_id}/runs/{run_id}/events").json()["events"]
+        assert "resume" not in [event["type"] for event in events]
+
+
+def test_resume_wait_returns_the_finished_run(monkeypatch, sqlite_path):
+    monkeypatch.setenv("MEETING_RUNNER", "stub")
+    app = server.create_app(sqlite_path)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/meetings", json={"topic": "cache", "roles": ["Chief Architect"], "max_rounds": 2, "pause_on_round": 1}
+        )
+        meeting_id = response.json()["meeting_id"]
+        run_id = client.post(f"/meetings/{meeting_id}/runs").json()["run_id"]
+        assert _wait_for_status(client, meeting_id, run_id)["run"]["status"] == "PAUSED"
+        events = client.get(f"/meetings/{meeting_id}/runs/{run_id}/events").json()["events"]
+        token = next(event["payload"]["resume_token"] for event in events if event["type"] == "pause")
+
+        resumed = client.post(
+            f"/meetings/{meeting_id}/runs/{run_id}/resume?wait=true", json={"resume_token": token, "answers": {"qps": 100}}
+        ).json()
+
+        assert resumed["status"] == "DONE"
+        assert set(resumed["artifacts"]) == {"ADR", "TASKS", "RISKS", "FLOWCHART"}
@@ -0,0 +1,85 @@
+import asyncio
+
+import orjson
+
+from meeting.api import server
+
+_STREAM_PATH = "/meetings/{meeting_id}/runs/{run_id}/events/stream"
+
+
+def _stream_endpoint(app):
+    return next(route.endpoint for route in app.routes if getattr(route, "path", "") == _STREAM_PATH)
+
+
+def _frame_data(frame):
+    line = next(line for line in frame.split(b"\n") if line.startswith(b"data: "))
+    return orjson.loads(line[len(b"data: "):])
+
+
+def _start_run(app):
+    storage = app.state.storage
+    meeting_id = storage.create_meeting({"topic": "cache"})
+    return meeting_id, storage.create_run(meeting_id, {"topic": "cache"})
+
+
+def test_stream_wakes_on_append_and_reuses_frames(monkeypatch, sqlite_path, make_event):
+    monkeypatch.setenv("MEETING_RUNNER", "stub")
+    monkeypatch.setattr(server, "_SSE_KEEPALIVE_S", 30.0)
+    app = server.create_app(sqlite_path)
+    meeting_id, run_id = _start_run(app)
+    event = dict(make_event("agent_message", "agent:A", {"round": 1}), run_id=run_id)
+
+    async def _run():
+        response = await _stream_endpoint(app)(meeting_id=meeting_id, run_id=run_id, tail=0, poll_ms=500)
+        stream = response.body_iterator
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.05)
+        assert not first.done()
+        # Append from a worker thread, as run writes may; the frame arrives long
+        # before the 30 s keep-alive deadline.
+        await asyncio.to_thread(app.state.storage.append_event_dict, event)
+        frame = await asyncio.wait_for(first, timeout=1.0)
+        await stream.aclose()
+
+        replay = (await _stream_endpoint(app)(meeting_id=meeting_id, run_id=run_id)).body_iterator
+        replayed = await replay.__anext__()
+        await replay.aclose()
+        return frame, replayed
+
+    frame, replayed = asyncio.run(_run())
+
+    data = _frame_data(frame)
+    assert (data["type"], data["payload"]["round"]) == ("agent_message", 1)
+    assert replayed is frame
+    assert app.state.event_signals == {}
+    app.state.storage.close()
+
+
+def test_stream_sends_keepalive_when_idle(monkeypatch, sqlite_path):
+    monkeypatch.setenv("MEETING_RUNNER", "stub")
+    monkeypatch.setattr(server, "_SSE_KEEPALIVE_S", 0.05)
+    app = server.create_app(sqlite_path)
+    meeting_id, run_id = _start_run(app)
+
+    async def _run():
+        stream = (await _stream_endpoint(app)(meeting_id=meeting_id, run_id=run_id)).body_iterator
+        frame = await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+        await stream.aclose()
+        return frame
+
+    assert asyncio.run(_run()) == b": keep-alive\n\n"
+    app.state.storage.close()
+
+
+def test_append_skips_subscribers_on_closed_loops(monkeypatch, sqlite_path, make_event):
+    monkeypatch.setenv("MEETING_RUNNER", "stub")
+    app = server.create_app(sqlite_path)
+    meeting_id, run_id = _start_run(app)
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.close()
+    app.state.event_signals[run_id] = {(closed_loop, asyncio.Event())}
+
+    app.state.storage.append_event_dict(dict(make_event("metric"), run_id=run_id))
+
+    assert [event["type"] for event in app.state.storage.list_events(run_id)] == ["metric"]
+    app.state.storage.close()
@@ -36,3 +36,16 @@ def test_validate_consensus_missing_key():
         assert False, "should raise ValidationError"
     except ValidationError:
         assert True
+
+
+def test_compute_consensus_tie_prefers_smallest_decision():
+    outputs = {
+        "A": {"decision_recommendation": "方案二"},
+        "B": {"decision_recommendation": "方案一"},
+        "C": {"decision_recommendation": " "},
+    }
+    votes, winner, score = _compute_consensus(outputs)
+    assert votes == {"方案二": 1, "方案一": 1}
+    assert winner == "方案一"
+    assert score == 0.5
+    assert _compute_consensus({}) == ({}, "", 0.0)
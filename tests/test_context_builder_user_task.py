@@ -0,0 +1,14 @@
+from meeting.domain.context_builder import build_user_task
+
+
+def test_build_user_task_skips_empty_constraints():
+    config = {"topic": "缓存设计", "background": "需要 10k QPS", "constraints": {}}
+
+    assert build_user_task(config) == "缓存设计\n需要 10k QPS"
+    assert build_user_task({"topic": "缓存设计", "constraints": None}) == "缓存设计"
+
+
+def test_build_user_task_appends_compact_constraints():
+    config = {"topic": "缓存设计", "background": "", "constraints": {"budget": "中等", "must_onprem": False}}
+
+    assert build_user_task(config) == '缓存设计\n{"budget":"中等","must_onprem":false}'
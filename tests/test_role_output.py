@@ -3,7 +3,7 @@ import json
 
 import pytest
 
-from meeting.domain.models import Event, Message, ValidationError
+from meeting.domain.models import Event, ValidationError
 from meeting.domain.state_machine import _run_speaker_turn
 from meeting.domain.validators import parse_and_validate_role_output
 
@@ -11,10 +11,15 @@ from meeting.domain.validators import parse_and_validate_role_output
 class MemoryStorage:
     def __init__(self) -> None:
         self.events = []
+        self.bulk_writes = 0
 
     def append_event_dict(self, event):
         self.events.append(event)
 
+    def append_events_bulk(self, events):
+        self.bulk_writes += 1
+        self.events.extend(events)
+
 
 class FakeRunner:
     def __init__(self, messages):
@@ -24,13 +29,6 @@ class FakeRunner:
     async def run(self, ctx):
         content = self._messages[min(self._index, len(self._messages) - 1)]
         self._index += 1
-        message = Message(
-            role="assistant",
-            content=content,
-            name=ctx.speaker,
-            ts_ms=0,
-            meta=None,
-        )
         yield Event(
             type="agent_message",
             run_id=ctx.run_id,
@@ -38,11 +36,11 @@ class FakeRunner:
             actor=f"agent:{ctx.speaker}",
             payload={
                 "message": {
-                    "role": message.role,
-                    "content": message.content,
-                    "name": message.name,
-                    "ts_ms": message.ts_ms,
-                    "meta": message.meta,
+                    "role": "assistant",
+                    "content": content,
+                    "name": ctx.speaker,
+                    "ts_ms": 0,
+                    "meta": None,
                 },
                 "message_id": "msg-test",
                 "round": ctx.round,
@@ -50,6 +48,41 @@ class FakeRunner:
         )
 
 
+class TokenRunner(FakeRunner):
+    async def run(self, ctx):
+        for idx in range(40):
+            yield Event(
+                type="token",
+                run_id=ctx.run_id,
+                ts_ms=0,
+                actor=f"agent:{ctx.speaker}",
+                payload={"text": str(idx)},
+            )
+        async for event in super().run(ctx):
+            yield event
+
+
+class SlowTokenRunner(FakeRunner):
+    def __init__(self, messages, storage):
+        super().__init__(messages)
+        self._storage = storage
+        self.stored_before_message = None
+
+    async def run(self, ctx):
+        for idx in range(3):
+            yield Event(
+                type="token",
+                run_id=ctx.run_id,
+                ts_ms=0,
+                actor=f"agent:{ctx.speaker}",
+                payload={"text": str(idx)},
+            )
+        await asyncio.sleep(0.2)
+        self.stored_before_message = [event["payload"]["text"] for event in self._storage.events]
+        async for event in super().run(ctx):
+            yield event
+
+
 def _valid_role_output():
     return {
         "assumptions": ["a1"],
@@ -74,6 +107,14 @@ def test_parse_role_output_fenced_json():
     assert parsed["assumptions"] == ["a1"]
 
 
+def test_parse_role_output_embedded_in_prose():
+    payload = _valid_role_output()
+    payload["proposal"] = 'use "{braces}" and \\"quotes\\" in text }'
+    text = f"以下是输出：{json.dumps(payload, ensure_ascii=False)} 以上。{{trailing}}"
+    parsed = parse_and_validate_role_output(text)
+    assert parsed["proposal"] == payload["proposal"]
+
+
 def test_parse_role_output_missing_key():
     payload = _valid_role_output()
     payload.pop("proposal")
@@ -113,3 +154,57 @@ def test_role_output_repair_flow():
         event.get("type") == "error" and event.get("payload", {}).get("stage") == "role_output_validation"
         for event in storage.events
     )
+
+
+def test_speaker_turn_batches_token_events():
+    storage = MemoryStorage()
+    runner = TokenRunner([json.dumps(_valid_role_output())])
+
+    last_message, _ = asyncio.run(
+        _run_speaker_turn(
+            storage=storage,
+            runner=runner,
+            meeting_id="m-1",
+            run_id="r-1",
+            round_index=1,
+            speaker="Chief Architect",
+            public_messages=[],
+            summary_messages=[],
+            private_memory={},
+            system_text="system",
+            user_task="task",
+            limits={"validate_role_output": False},
+        )
+    )
+
+    assert last_message
+    assert storage.bulk_writes == 2
+    assert [event["type"] for event in storage.events] == ["token"] * 40 + ["agent_message"]
+    assert [event["payload"]["text"] for event in storage.events[:40]] == [str(idx) for idx in range(40)]
+    assert storage.events[0]["payload"]["event_code"] == "AGENT_TOKEN"
+
+
+def test_speaker_turn_flushes_partial_token_batch_on_timer():
+    storage = MemoryStorage()
+    runner = SlowTokenRunner([json.dumps(_valid_role_output())], storage)
+
+    asyncio.run(
+        _run_speaker_turn(
+            storage=storage,
+            runner=runner,
+            meeting_id="m-1",
+            run_id="r-1",
+            round_index=1,
+            speaker="Chief Architect",
+            public_messages=[],
+            summary_messages=[],
+            private_memory={},
+            system_text="system",
+            user_task="task",
+            limits={"validate_role_output": False},
+        )
+    )
+
+    assert runner.stored_before_message == ["0", "1", "2"]
+    assert storage.bulk_writes == 1
+    assert [event["type"] for event in storage.events] == ["token"] * 3 + ["agent_message"]
@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+import pytest
+
+from meeting.domain.models import Event
+from meeting.domain.state_machine import _attach_event_code, _event_dict, run_meeting
+
+
+def _role_output(decision):
+    return {
+        "assumptions": ["a1"],
+        "proposal": "p1",
+        "tradeoffs": ["t1"],
+        "risks": [{"risk": "r1", "impact": "M", "mitigation": "m1", "verification": "v1"}],
+        "questions": [],
+        "decision_recommendation": decision,
+    }
+
+
+def _summary_output(round_index):
+    return {
+        "round": round_index,
+        "summary": f"r{round_index}",
+        "open_questions": [],
+        "decisions": [],
+        "risks": [],
+        "next_steps": [],
+    }
+
+
+class ScriptedRunner:
+    def __init__(self, recorder_error=None, role_output=None):
+        self.recorder_error = recorder_error
+        self.role_output = role_output or _role_output("d1")
+        self.recorder_history = None
+
+    async def run(self, ctx):
+        if ctx.speaker == "Recorder" and "请总结" in ctx.user_task:
+            content = json.dumps(_summary_output(ctx.round))
+        elif ctx.speaker == "Recorder":
+            if self.recorder_error:
+                raise self.recorder_error
+            self.recorder_history = [message.meta["round"] for message in ctx.public_messages]
+            content = "final notes"
+        else:
+            content = json.dumps(self.role_output)
+        yield Event(
+            type="agent_message",
+            run_id=ctx.run_id,
+            ts_ms=0,
+            actor=f"agent:{ctx.speaker}",
+            payload={
+                "message": {"role": "assistant", "content": content, "name": ctx.speaker, "ts_ms": 0, "meta": {"round": ctx.round}},
+                "message_id": "msg-test",
+                "round": ctx.round,
+            },
+        )
+
+
+def _layered_config():
+    return {
+        "roles": ["Chief Architect", "Skeptic"],
+        "max_rounds": 2,
+        "context_mode": "layered",
+        "parallel_mode": True,
+        "termination": {"min_rounds": 2},
+    }
+
+
+def _start(storage, config):
+    meeting_id = storage.create_meeting(config)
+    return meeting_id, storage.create_run(meeting_id, config)
+
+
+def test_run_meeting_round_summary_precedes_consensus(storage):
+    config = _layered_config()
+    meeting_id, run_id = _start(storage, config)
+
+    result = asyncio.run(run_meeting(storage, ScriptedRunner(), meeting_id, run_id, config, "task"))
+
+    assert result["status"] == "DONE"
+    events = storage.list_events(run_id, types=("round_started", "artifact_written", "metric", "summary_written"))
+    order = [
+        (event["type"], event["payload"].get("round") or event["payload"].get("artifact_type"))
+        for event in events
+    ]
+    assert order[:8] == [
+        ("round_started", 1),
+        ("summary_written", 1),
+        ("artifact_written", "CONSENSUS"),
+        ("metric", None),
+        ("round_started", 2),
+        ("summary_written", 2),
+        ("artifact_written", "CONSENSUS"),
+        ("metric", None),
+    ]
+    assert [item["content"]["round"] for item in storage.list_summaries(run_id)] == [1, 2]
+
+
+def test_run_meeting_recorder_failure_keeps_round_summaries(storage):
+    config = _layered_config()
+    meeting_id, run_id = _start(storage, config)
+    runner = ScriptedRunner(recorder_error=RuntimeError("recorder down"))
+
+    with pytest.raises(RuntimeError, match="recorder down"):
+        asyncio.run(run_meeting(storage, runner, meeting_id, run_id, config, "task"))
+
+    summaries = storage.list_events(run_id, types=("summary_written",))
+    assert [event["payload"]["round"] for event in summaries] == [1, 2]
+    assert storage.list_summaries(run_id)[-1]["content"]["round"] == 2
+
+
+def test_run_meeting_stores_first_memory_for_noop_output(storage):
+    config = _layered_config()
+    meeting_id, run_id = _start(storage, config)
+    noop_output = dict(_role_output(""), assumptions=[], proposal="", tradeoffs=[], risks=[])
+
+    asyncio.run(run_meeting(storage, ScriptedRunner(role_output=noop_output), meeting_id, run_id, config, "task"))
+
+    assert sorted(item["role_name"] for item in storage.list_memories(run_id)) == ["Chief Architect", "Skeptic"]
+    assert storage.get_memory(run_id, "Skeptic") == {
+        "assumptions": [],
+        "notes": [],
+        "pending_checks": [],
+        "risks_pool": [],
+        "drafts": [],
+    }
+
+
+def test_run_meeting_public_history_cap_keeps_tail(storage):
+    config = {
+        "roles": ["Chief Architect"],
+        "max_rounds": 4,
+        "termination": {"min_rounds": 4},
+        "limits": {"public_history_max_messages": 2},
+    }
+    meeting_id, run_id = _start(storage, config)
+    runner = ScriptedRunner()
+
+    asyncio.run(run_meeting(storage, runner, meeting_id, run_id, config, "task"))
+
+    assert runner.recorder_history == [3, 4]
+
+
+def test_event_helpers_leave_caller_payload_untouched():
+    payload = {"round": 1}
+    runner_event = {"type": "agent_message", "run_id": "run", "ts_ms": 1, "actor": "Skeptic", "payload": payload}
+
+    written = _event_dict("round_started", "run", "system", payload)
+    streamed = _attach_event_code(runner_event)
+
+    assert payload == {"round": 1}
+    assert "event_code" in written["payload"]
+    assert "event_code" in streamed["payload"]
+    assert streamed["payload"] is not payload
@@ -0,0 +1,45 @@
+import math
+
+from meeting.api.server import _json_response, _merge_config, _parse_config, _user_task_for_config
+
+
+def test_parse_config_returns_independent_dicts():
+    config_json = '{"topic": "cache", "constraints": {"latency": "p99 < 50ms"}}'
+
+    first = _parse_config(config_json)
+    first["constraints"]["latency"] = "changed"
+
+    assert _parse_config(config_json)["constraints"] == {"latency": "p99 < 50ms"}
+    assert "p99 < 50ms" in _user_task_for_config(config_json)
+
+
+def test_merge_config_nested_overrides_copy_only_the_override_path():
+    base = {
+        "topic": "cache",
+        "termination": {"max_rounds": 3, "thresholds": {"open_questions_max": 2, "disagreements_max": 1}},
+        "constraints": {"budget": "medium"},
+        "roles": ["Chief Architect"],
+    }
+    overrides = {"termination": {"thresholds": {"open_questions_max": 0}}, "roles": ["Skeptic"]}
+
+    merged = _merge_config(base, overrides)
+
+    assert merged["termination"] == {"max_rounds": 3, "thresholds": {"open_questions_max": 0, "disagreements_max": 1}}
+    assert merged["roles"] == ["Skeptic"]
+    assert base["termination"] == {"max_rounds": 3, "thresholds": {"open_questions_max": 2, "disagreements_max": 1}}
+    assert base["roles"] == ["Chief Architect"]
+    assert merged["termination"] is not base["termination"]
+    assert merged["constraints"] is base["constraints"]
+
+
+def test_parse_config_reads_stdlib_json_specials():
+    config = _parse_config('{"topic": "cache", "termination": {"score_min": NaN, "budget": Infinity}}')
+
+    assert math.isnan(config["termination"]["score_min"])
+    assert config["termination"]["budget"] == math.inf
+
+
+def test_json_response_encodes_non_str_keys_and_big_ints():
+    response = _json_response({"votes": {1: 2}, "budget": 2**70})
+
+    assert response.body == b'{"votes":{"1":2},"budget":1180591620717411303424}'
@@ -0,0 +1,20 @@
+import sqlite3
+
+import pytest
+
+from meeting.storage.repo import StorageRepo
+
+
+def test_close_also_closes_borrowed_readers(storage):
+    with storage._reader() as conn:
+        storage.close()
+        assert conn.execute("SELECT 1").fetchone()[0] == 1
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert storage._read_pool.empty()
+
+
+def test_memory_database_is_rejected():
+    with pytest.raises(ValueError):
+        StorageRepo(":memory:")
@@ -0,0 +1,68 @@
+def test_iter_events_pages_and_filters_tokens(storage, make_event):
+    for idx in range(5):
+        storage.append_event_dict(make_event("token", "agent:A", {"text": str(idx)}))
+        storage.append_event_dict(make_event("agent_message", "agent:A", {"round": idx}))
+
+    events = list(storage.iter_events("r-x"))
+    assert events == []
+
+    run_id = make_event()["run_id"]
+    paged = list(storage.iter_events(run_id, batch_size=3))
+    assert paged == storage.list_events(run_id)
+
+    no_tokens = list(storage.iter_events(run_id, include_tokens=False, batch_size=2))
+    assert [event["payload"]["round"] for event in no_tokens] == [0, 1, 2, 3, 4]
+
+
+def test_append_events_bulk_keeps_order_and_notifies_once(storage, make_event):
+    notified = []
+    storage.add_event_listener(notified.append)
+    run_id = make_event()["run_id"]
+
+    storage.append_events_bulk(
+        [make_event("artifact_written", "recorder", {"artifact_type": kind}) for kind in ("ADR", "TASKS", "RISKS")]
+    )
+    storage.append_events_bulk([])
+
+    assert [event["payload"]["artifact_type"] for event in storage.list_events(run_id)] == ["ADR", "TASKS", "RISKS"]
+    assert notified == [run_id]
+
+
+def test_list_events_filters_by_type(storage, make_event):
+    for kind in ("round_started", "token", "agent_message", "token", "resume", "agent_message"):
+        storage.append_event_dict(make_event(kind, "agent:A", {"kind": kind}))
+    run_id = make_event()["run_id"]
+
+    public = storage.list_events(run_id, types=("agent_message", "resume"))
+    assert [event["type"] for event in public] == ["agent_message", "resume", "agent_message"]
+    assert len(storage.list_events(run_id)) == 6
+
+
+def test_failing_listener_does_not_fail_the_write(storage, make_event):
+    notified = []
+
+    def _broken(run_id):
+        raise RuntimeError("subscriber loop closed")
+
+    storage.add_event_listener(_broken)
+    storage.add_event_listener(notified.append)
+    run_id = make_event()["run_id"]
+
+    storage.append_event_dict(make_event("round_started"))
+    storage.append_events_bulk([make_event("metric")])
+
+    assert [event["type"] for event in storage.list_events(run_id)] == ["round_started", "metric"]
+    assert notified == [run_id, run_id]
+
+
+def test_json_columns_accept_what_stdlib_json_wrote(storage, make_event):
+    config = {"topic": "cache", "constraints": {1: "non-str key"}, "budget": 2**70}
+
+    meeting_id = storage.create_meeting(config)
+    run_id = storage.create_run(meeting_id, config)
+    storage.append_event_dict(dict(make_event("resume", "user", {"answers": {"qps": 2**70}}), run_id=run_id))
+
+    assert storage.get_meeting(meeting_id)["config_json"] == (
+        '{"topic":"cache","constraints":{"1":"non-str key"},"budget":1180591620717411303424}'
+    )
+    assert storage.list_events(run_id)[0]["payload"]["answers"] == {"qps": 2**70}
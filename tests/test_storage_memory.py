@@ -9,3 +9,17 @@ def test_memory_roundtrip(storage):
     assert memories
     roles = {item["role_name"] for item in memories}
     assert "Chief Architect" in roles
+
+
+def test_upsert_memories_bulk(storage):
+    storage.upsert_memory("r-1", "Chief Architect", {"assumptions": ["a1"]})
+    storage.upsert_memories_bulk(
+        "r-1",
+        [("Chief Architect", {"assumptions": ["a2"]}), ("Security", {"notes": ["n1"]})],
+    )
+
+    assert storage.get_memory("r-1", "Chief Architect") == {"assumptions": ["a2"]}
+    assert storage.get_memory("r-1", "Security") == {"notes": ["n1"]}
+
+    latest = {item["role_name"]: item["content"] for item in storage.list_memories("r-1")}
+    assert latest == {"Chief Architect": {"assumptions": ["a2"]}, "Security": {"notes": ["n1"]}}
@@ -22,3 +22,37 @@ def test_list_summaries(storage):
     assert len(summaries) == 2
     assert summaries[0]["content"]["round"] == 1
     assert summaries[1]["content"]["round"] == 2
+
+
+def test_list_summaries_bulk_keeps_order(storage):
+    summaries = [
+        {"round": idx, "summary": f"r{idx}", "open_questions": [], "decisions": [], "risks": [], "next_steps": []}
+        for idx in range(1, 4)
+    ]
+    storage.save_artifacts_with_events(
+        "r-1",
+        "recorder",
+        [("SUMMARY", "v2", summary, "summary_written", {"round": summary["round"]}) for summary in summaries],
+    )
+
+    assert [item["content"]["round"] for item in storage.list_summaries("r-1")] == [1, 2, 3]
+    assert [item["content"]["round"] for item in storage.list_summaries("r-1", limit=2)] == [2, 3]
+
+
+def test_save_artifacts_with_events_shares_content(storage, adr_content):
+    storage.save_artifacts_with_events(
+        "r-1",
+        "recorder",
+        [
+            ("ADR", "v1", adr_content, "artifact_written", {"artifact_type": "ADR", "version": "v1"}),
+            ("SUMMARY", "v1", {"text": "done"}, "summary_written", {}),
+        ],
+    )
+
+    artifacts = storage.list_artifacts("r-1")
+    assert [item["content"] for item in artifacts] == [adr_content, {"text": "done"}]
+    assert artifacts[0]["created_ts_ms"] == artifacts[1]["created_ts_ms"]
+    events = storage.list_events("r-1")
+    assert [event["type"] for event in events] == ["artifact_written", "summary_written"]
+    assert events[0]["payload"] == {"artifact_type": "ADR", "version": "v1", "content": adr_content}
+    assert events[1]["payload"] == {"content": {"text": "done"}}
@@ -457,7 +457,7 @@ export function StageView({ meeting, run }: StageViewProps) {
 
     void loadHistory()
 
-    const url = `${API_BASE}/meetings/${run.meeting_id}/runs/${run.id}/events/stream?tail=300&poll_ms=500`
+    const url = `${API_BASE}/meetings/${run.meeting_id}/runs/${run.id}/events/stream?tail=300`
     const source = new EventSource(url)
 
     source.onopen = () => setConnection("open")